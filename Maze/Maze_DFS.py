@@ -1,12 +1,17 @@
 import pygame
-import random
-import time
-from collections import deque
+
+import maze_core
+from maze_core.generators import generate_maze
+from maze_core.render import MazeRenderer
+from maze_core.scheduler import StepScheduler
+from maze_core.trace import SearchTrace, add_hook, json_lines
 
 # Maze settings
 WIDTH, HEIGHT = 800, 800
 ROWS, COLS = 15, 15
 CELL_SIZE = WIDTH // COLS
+OBSTACLES = (ROWS * COLS) // 8  # Random wall cells added on top of the open grid
+TRACE = True  # Print a JSON record of search counters after every solve
 
 # Colors - Neon Theme
 BACKGROUND = (10, 10, 30)
@@ -18,62 +23,31 @@ END = (255, 128, 0)  # Neon Orange
 VISITED = (80, 0, 120)  # Dark Purple
 SOLUTION = (255, 255, 0)  # Yellow for solution path
 
-# Directions (Right, Down, Left, Up)
-DIRECTIONS = [(1, 0), (0, 1), (-1, 0), (0, -1)]
-
-
-def generate_maze(rows, cols):
-    maze = [[1] * cols for _ in range(rows)]
-    stack = [(0, 0)]
-    visited = set(stack)
-
-    while stack:
-        x, y = stack[-1]
-        neighbors = [(x + dx, y + dy) for dx, dy in DIRECTIONS
-                     if 0 <= x + dx < cols and 0 <= y + dy < rows]
-        unvisited_neighbors = [(nx, ny) for nx, ny in neighbors if (nx, ny) not in visited]
-
-        if unvisited_neighbors:
-            nx, ny = random.choice(unvisited_neighbors)
-            maze[y][x] = 0
-            maze[ny][nx] = 0
-            stack.append((nx, ny))
-            visited.add((nx, ny))
-        else:
-            stack.pop()
-
-    # Add random obstacles (about 20% of the free cells)
-    for _ in range((rows * cols) // 8):
-        while True:
-            ox, oy = random.randint(0, cols - 1), random.randint(0, rows - 1)
-            if (ox, oy) not in [(0, 0), (cols - 1, rows - 1)] and \
-                    (ox, oy) not in [(0, 1), (1, 0), (cols - 2, rows - 1), (cols - 1, rows - 2)]:
-                maze[oy][ox] = 1
-                break
-
-    return maze
-
-
-def draw_maze(screen, maze, path, current=None, solution_path=None):
-    for y in range(ROWS):
-        for x in range(COLS):
-            if solution_path and (x, y) in solution_path:
-                color = SOLUTION  # Solution path
-            elif (x, y) == (0, 0):
-                color = START  # Start position
-            elif (x, y) == (COLS - 1, ROWS - 1):
-                color = END  # End position
-            elif (x, y) == current:
-                color = CURRENT  # Node being processed
-            elif (x, y) in path:
-                color = PATH  # Explored path
-            elif maze[y][x] == 1:
-                color = WALL  # Obstacle
-            else:
-                color = VISITED  # Open space
-            pygame.draw.rect(screen, color, (x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE))
-            # Add grid lines
-            pygame.draw.rect(screen, BACKGROUND, (x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE), 1)
+
+def cell_color(maze, x, y, path, current=None, solution_path=None):
+    if solution_path and (x, y) in solution_path:
+        return SOLUTION  # Solution path
+    elif (x, y) == (0, 0):
+        return START  # Start position
+    elif (x, y) == (COLS - 1, ROWS - 1):
+        return END  # End position
+    elif (x, y) == current:
+        return CURRENT  # Node being processed
+    elif (x, y) in path:
+        return PATH  # Explored path
+    elif maze[y][x] == 1:
+        return WALL  # Obstacle
+    else:
+        return VISITED  # Open space
+
+
+def draw_maze(renderer, maze, path, current=None, solution_path=None, cells=None):
+    # Repaint only the given cells (all of them by default); the renderer
+    # skips any whose color did not change
+    if cells is None:
+        cells = [(x, y) for y in range(ROWS) for x in range(COLS)]
+    for x, y in cells:
+        renderer.paint(x, y, cell_color(maze, x, y, path, current, solution_path))
 
 
 def draw_text(screen, text, x, y):
@@ -82,66 +56,63 @@ def draw_text(screen, text, x, y):
     screen.blit(text_surface, (x, y))
 
 
-def dfs_solve(screen, maze):
-    start = (0, 0)
-    goal = (COLS - 1, ROWS - 1)
-
-    stack = [([start], start)]
-    visited = set([start])
-    path = set()
+def dfs_solve(renderer, scheduler, maze):
+    renderer.invalidate()
+    draw_maze(renderer, maze, set())
+    renderer.flush()
+    previous = []
 
-    while stack:
-        current_path, (x, y) = stack.pop()
+    def on_step(current, explored):
+        # Only the previous and the new current cell change color each step
+        draw_maze(renderer, maze, explored, current=current, cells=previous + [current])
+        previous[:] = [current]
 
-        # Update screen each step
-        path.update(current_path)
-        draw_maze(screen, maze, path, current=(x, y))
-        pygame.display.flip()
-        pygame.time.delay(100)  # Faster animation
-
-        if (x, y) == goal:
-            return current_path  # Final path to goal
-
-        # Reverse directions to make the search more visually interesting
-        for dx, dy in reversed(DIRECTIONS):
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < COLS and 0 <= ny < ROWS and maze[ny][nx] == 0 and (nx, ny) not in visited:
-                visited.add((nx, ny))
-                stack.append((current_path + [(nx, ny)], (nx, ny)))
-
-    return None  # No solution found
+    trace = SearchTrace('dfs', maze)
+    result = scheduler.run(maze_core.dfs_steps(maze), on_step, renderer.flush, trace)
+    trace.finish(result)
+    return result.path
 
 
 def main():
     pygame.init()
+    if TRACE:
+        add_hook(json_lines())
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("DFS Maze Solver")
+    renderer = MazeRenderer(screen, ROWS, COLS, CELL_SIZE, grid_color=BACKGROUND)
+    scheduler = StepScheduler(fps=10)  # One step per frame matches the old 100 ms delay
 
-    maze = generate_maze(ROWS, COLS)
+    maze = generate_maze(ROWS, COLS, OBSTACLES)
     screen.fill(BACKGROUND)
 
-    solution_path = dfs_solve(screen, maze)
+    solution_path = dfs_solve(renderer, scheduler, maze)
 
     running = True
+    redraw = True
     while running:
-        screen.fill(BACKGROUND)
+        if redraw:
+            screen.fill(BACKGROUND)
+            renderer.invalidate()
 
-        if solution_path:
-            draw_maze(screen, maze, set(solution_path), solution_path=solution_path)
-        else:
-            draw_maze(screen, maze, set())
+            if solution_path:
+                solution_cells = set(solution_path)
+                draw_maze(renderer, maze, solution_cells, solution_path=solution_cells)
+            else:
+                draw_maze(renderer, maze, set())
 
-        draw_text(screen, f"DFS: {'Solved!' if solution_path else 'No Solution!'}", 10, HEIGHT - 70)
-        draw_text(screen, "Press R to regenerate", 10, HEIGHT - 40)
-        pygame.display.flip()
+            draw_text(screen, f"DFS: {'Solved!' if solution_path else 'No Solution!'}", 10, HEIGHT - 70)
+            draw_text(screen, "Press R to regenerate", 10, HEIGHT - 40)
+            pygame.display.flip()
+            redraw = False
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_r:  # Press R to regenerate maze
-                    maze = generate_maze(ROWS, COLS)
-                    solution_path = dfs_solve(screen, maze)
+                    maze = generate_maze(ROWS, COLS, OBSTACLES)
+                    solution_path = dfs_solve(renderer, scheduler, maze)
+                    redraw = True
 
     pygame.quit()
 
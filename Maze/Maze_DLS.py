@@ -1,11 +1,17 @@
 import pygame
-import random
-import time
+
+import maze_core
+from maze_core.generators import generate_maze
+from maze_core.render import MazeRenderer
+from maze_core.scheduler import StepScheduler
+from maze_core.trace import SearchTrace, add_hook, json_lines
 
 # Maze settings
 WIDTH, HEIGHT = 800, 800
 ROWS, COLS = 15, 15
 CELL_SIZE = WIDTH // COLS
+OBSTACLES = (ROWS * COLS) // 8  # Random wall cells added on top of the open grid
+TRACE = True  # Print a JSON record of search counters after every solve
 
 # Colors - Neon Theme
 BACKGROUND = (10, 10, 30)
@@ -16,60 +22,29 @@ START = (0, 255, 128)  # Neon Green
 END = (255, 128, 0)  # Neon Orange
 VISITED = (80, 0, 120)  # Dark Purple
 
-# Directions (Right, Down, Left, Up)
-DIRECTIONS = [(1, 0), (0, 1), (-1, 0), (0, -1)]
-
-
-def generate_maze(rows, cols):
-    maze = [[1] * cols for _ in range(rows)]
-    stack = [(0, 0)]
-    visited = set(stack)
-
-    while stack:
-        x, y = stack[-1]
-        neighbors = [(x + dx, y + dy) for dx, dy in DIRECTIONS
-                     if 0 <= x + dx < cols and 0 <= y + dy < rows]
-        unvisited_neighbors = [(nx, ny) for nx, ny in neighbors if (nx, ny) not in visited]
-
-        if unvisited_neighbors:
-            nx, ny = random.choice(unvisited_neighbors)
-            maze[y][x] = 0
-            maze[ny][nx] = 0
-            stack.append((nx, ny))
-            visited.add((nx, ny))
-        else:
-            stack.pop()
-
-    # Add random obstacles (about 20% of the free cells)
-    for _ in range((rows * cols) // 8):
-        while True:
-            ox, oy = random.randint(0, cols - 1), random.randint(0, rows - 1)
-            if (ox, oy) not in [(0, 0), (cols - 1, rows - 1)] and \
-                    (ox, oy) not in [(0, 1), (1, 0), (cols - 2, rows - 1), (cols - 1, rows - 2)]:
-                maze[oy][ox] = 1
-                break
-
-    return maze
-
-
-def draw_maze(screen, maze, path, current=None):
-    for y in range(ROWS):
-        for x in range(COLS):
-            if (x, y) == (0, 0):
-                color = START  # Start position
-            elif (x, y) == (COLS - 1, ROWS - 1):
-                color = END  # End position
-            elif (x, y) == current:
-                color = CURRENT  # Node being processed
-            elif (x, y) in path:
-                color = PATH  # Explored path
-            elif maze[y][x] == 1:
-                color = WALL  # Obstacle
-            else:
-                color = VISITED  # Open space
-            pygame.draw.rect(screen, color, (x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE))
-            # Add grid lines
-            pygame.draw.rect(screen, BACKGROUND, (x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE), 1)
+
+def cell_color(maze, x, y, path, current=None):
+    if (x, y) == (0, 0):
+        return START  # Start position
+    elif (x, y) == (COLS - 1, ROWS - 1):
+        return END  # End position
+    elif (x, y) == current:
+        return CURRENT  # Node being processed
+    elif (x, y) in path:
+        return PATH  # Explored path
+    elif maze[y][x] == 1:
+        return WALL  # Obstacle
+    else:
+        return VISITED  # Open space
+
+
+def draw_maze(renderer, maze, path, current=None, cells=None):
+    # Repaint only the given cells (all of them by default); the renderer
+    # skips any whose color did not change
+    if cells is None:
+        cells = [(x, y) for y in range(ROWS) for x in range(COLS)]
+    for x, y in cells:
+        renderer.paint(x, y, cell_color(maze, x, y, path, current))
 
 
 def draw_text(screen, text, x, y):
@@ -78,83 +53,83 @@ def draw_text(screen, text, x, y):
     screen.blit(text_surface, (x, y))
 
 
-def dls_solve(screen, maze, depth_limit):
-    start = (0, 0)
-    goal = (COLS - 1, ROWS - 1)
-
-    # Stack now contains (path, current_position, current_depth)
-    stack = [([start], start, 0)]
-    visited = set([start])
-    path = set()
+def dls_solve(renderer, scheduler, maze, depth_limit):
+    renderer.invalidate()
+    draw_maze(renderer, maze, set())
+    renderer.flush()
+    previous = []
 
-    while stack:
-        current_path, (x, y), depth = stack.pop()
+    def on_step(current, explored):
+        # Only the previous and the new current cell change color each step
+        draw_maze(renderer, maze, explored, current=current, cells=previous + [current])
+        previous[:] = [current]
 
-        # Update screen each step
-        path.update(current_path)
-        draw_maze(screen, maze, path, current=(x, y))
-        pygame.display.flip()
-        pygame.time.delay(100)  # Animation delay
-
-        if (x, y) == goal:
-            return current_path  # Final path to goal
-
-        # If we've reached the depth limit, don't explore further from this node
-        if depth >= depth_limit:
-            continue
-
-        # Check neighbors
-        for dx, dy in DIRECTIONS[::-1]:
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < COLS and 0 <= ny < ROWS and maze[ny][nx] == 0 and (nx, ny) not in visited:
-                visited.add((nx, ny))
-                stack.append((current_path + [(nx, ny)], (nx, ny), depth + 1))
-
-    return None  # No solution found
+    trace = SearchTrace('dls', maze)
+    result = scheduler.run(maze_core.dls_steps(maze, depth_limit), on_step, renderer.flush, trace)
+    trace.finish(result, depth_limit=depth_limit)
+    return result.path
 
 
 def main():
     pygame.init()
+    if TRACE:
+        add_hook(json_lines())
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("Neon Maze Solver")
+    renderer = MazeRenderer(screen, ROWS, COLS, CELL_SIZE, grid_color=BACKGROUND)
+    scheduler = StepScheduler(fps=10)  # One step per frame matches the old 100 ms delay
 
     # Calculate a reasonable depth limit based on maze size
     # For a square maze, the Manhattan distance to any point can't exceed (ROWS + COLS - 2)
     default_depth_limit = (ROWS + COLS) * 2  # Using a higher limit to ensure solvability
 
-    maze = generate_maze(ROWS, COLS)
+    maze = generate_maze(ROWS, COLS, OBSTACLES)
     screen.fill(BACKGROUND)
 
-    path = dls_solve(screen, maze, default_depth_limit)
+    path = dls_solve(renderer, scheduler, maze, default_depth_limit)
 
     running = True
+    redraw = True
     message = f"Solved with DLS! (Depth Limit: {default_depth_limit})" if path else "No Solution Found!"
 
     depth_limit = default_depth_limit
 
     while running:
-        screen.fill(BACKGROUND)
+        if redraw:
+            screen.fill(BACKGROUND)
+            renderer.invalidate()
 
-        draw_maze(screen, maze, path)
-        draw_text(screen, message, 10, HEIGHT - 40)
-        pygame.display.flip()
+            draw_maze(renderer, maze, set(path or ()))
+            draw_text(screen, message, 10, HEIGHT - 40)
+            pygame.display.flip()
+            redraw = False
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_r:  # Press R to regenerate maze
-                    maze = generate_maze(ROWS, COLS)
-                    path = dls_solve(screen, maze, depth_limit)
+                    maze = generate_maze(ROWS, COLS, OBSTACLES)
+                    path = dls_solve(renderer, scheduler, maze, depth_limit)
                     message = f"Solved with DLS! (Depth Limit: {depth_limit})" if path else "No Solution Found!"
+                    redraw = True
                 elif event.key == pygame.K_UP:  # Press Up to increase depth limit
                     depth_limit += 5
-                    path = dls_solve(screen, maze, depth_limit)
+                    path = dls_solve(renderer, scheduler, maze, depth_limit)
                     message = f"Solved with DLS! (Depth Limit: {depth_limit})" if path else "No Solution Found!"
+                    redraw = True
                 elif event.key == pygame.K_DOWN and depth_limit > 5:  # Press Down to decrease depth limit
                     depth_limit -= 5
-                    path = dls_solve(screen, maze, depth_limit)
+                    path = dls_solve(renderer, scheduler, maze, depth_limit)
+                    message = f"Solved with DLS! (Depth Limit: {depth_limit})" if path else "No Solution Found!"
+                    redraw = True
+                elif event.key == pygame.K_m:  # Press M to jump to the smallest limit (in steps of 5) that works
+                    _, smallest = maze_core.dls_sweep(maze, range(5, ROWS * COLS + 5, 5))
+                    if smallest is not None:
+                        depth_limit = smallest
+                    path = dls_solve(renderer, scheduler, maze, depth_limit)
                     message = f"Solved with DLS! (Depth Limit: {depth_limit})" if path else "No Solution Found!"
+                    redraw = True
 
     pygame.quit()
 
@@ -1,11 +1,17 @@
 import pygame
-import random
-import heapq
+
+import maze_core
+from maze_core.generators import generate_maze
+from maze_core.render import MazeRenderer
+from maze_core.scheduler import StepScheduler
+from maze_core.trace import SearchTrace, add_hook, json_lines
 
 # Maze settings - Larger maze
 WIDTH, HEIGHT = 400, 400
 ROWS, COLS = 15, 15  # More cells
 CELL_SIZE = WIDTH // COLS
+OBSTACLES = (ROWS * COLS) // 4  # Random wall cells added on top of the open grid
+TRACE = True  # Print a JSON record of search counters after every solve
 
 # Rose-themed Colors
 WHITE = (255, 255, 255)
@@ -20,130 +26,95 @@ MAUVE = (224, 176, 255)        # Solution path color
 # Player movement directions
 DIRECTIONS = [(0, -1), (0, 1), (-1, 0), (1, 0)]
 
-def generate_maze(rows, cols):
-    maze = [[1] * cols for _ in range(rows)]
-    stack = [(0, 0)]
-    visited = set(stack)
-
-    while stack:
-        x, y = stack[-1]
-        neighbors = [(x + dx, y + dy) for dx, dy in DIRECTIONS
-                     if 0 <= x + dx < cols and 0 <= y + dy < rows]
-        neighbors = [(nx, ny) for nx, ny in neighbors if (nx, ny) not in visited]
-
-        if neighbors:
-            nx, ny = random.choice(neighbors)
-            maze[y][x] = 0
-            maze[ny][nx] = 0
-            stack.append((nx, ny))
-            visited.add((nx, ny))
-        else:
-            stack.pop()
-
-    # Add more walls for complexity
-    for _ in range((rows * cols) // 4):
-        while True:
-            ox, oy = random.randint(0, cols - 1), random.randint(0, rows - 1)
-            if (ox, oy) not in [(0, 0), (cols - 1, rows - 1)] and \
-               (ox, oy) not in [(0, 1), (1, 0), (cols - 2, rows - 1), (cols - 1, rows - 2)]:
-                maze[oy][ox] = 1
-                break
-
-    return maze
-
-def draw_maze(screen, maze, path, current=None, solution_path=None):
-    for y in range(ROWS):
-        for x in range(COLS):
-            if (x, y) == (0, 0):
-                color = DEEP_ROSE  # Start position
-            elif (x, y) == (COLS - 1, ROWS - 1):
-                color = LIGHT_PINK  # Goal position
-            elif solution_path and (x, y) in solution_path:
-                color = MAUVE  # Highlight solution path
-            elif (x, y) in path:
-                color = BABY_PINK
-            elif maze[y][x] == 1:
-                color = ROSE
-            else:
-                color = WHITE
-            pygame.draw.rect(screen, color, (x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE - 1, CELL_SIZE - 1))
-
-    if current:
-        pygame.draw.rect(screen, HOT_PINK, (current[0] * CELL_SIZE, current[1] * CELL_SIZE, CELL_SIZE - 1, CELL_SIZE - 1))
-
-    pygame.display.flip()
-    pygame.time.delay(50)  # Faster animation
-
-def heuristic(a, b):
-    return abs(a[0] - b[0]) + abs(a[1] - b[1])
-
-def a_star_solve(screen, maze):
-    start, goal = (0, 0), (COLS - 1, ROWS - 1)
-    pq = [(0 + heuristic(start, goal), 0, start, [start])]
-    visited = set()
-
-    while pq:
-        f, g, (x, y), path = heapq.heappop(pq)
-
-        if (x, y) in visited:
-            continue
-        visited.add((x, y))
-        draw_maze(screen, maze, visited, current=(x, y))
-
-        if (x, y) == goal:
-            print("Maze Solved with A*!")
-            return path
-
-        for dx, dy in DIRECTIONS:
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < COLS and 0 <= ny < ROWS and maze[ny][nx] == 0:
-                new_g = g + 1
-                new_f = new_g + heuristic((nx, ny), goal)
-                heapq.heappush(pq, (new_f, new_g, (nx, ny), path + [(nx, ny)]))
-
-    return None
-
-def greedy_solve(screen, maze):
-    start, goal = (0, 0), (COLS - 1, ROWS - 1)
-    pq = [(heuristic(start, goal), start, [start])]
-    visited = set()
-
-    while pq:
-        h, (x, y), path = heapq.heappop(pq)
-
-        if (x, y) in visited:
-            continue
-        visited.add((x, y))
-        draw_maze(screen, maze, visited, current=(x, y))
-
-        if (x, y) == goal:
-            print("Maze Solved with Greedy Search!")
-            return path
-
-        for dx, dy in DIRECTIONS:
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < COLS and 0 <= ny < ROWS and maze[ny][nx] == 0:
-                heapq.heappush(pq, (heuristic((nx, ny), goal), (nx, ny), path + [(nx, ny)]))
-
-    return None
+def cell_color(maze, x, y, path, current=None, solution_path=None):
+    if (x, y) == current:
+        return HOT_PINK  # Current search node
+    elif (x, y) == (0, 0):
+        return DEEP_ROSE  # Start position
+    elif (x, y) == (COLS - 1, ROWS - 1):
+        return LIGHT_PINK  # Goal position
+    elif solution_path and (x, y) in solution_path:
+        return MAUVE  # Highlight solution path
+    elif (x, y) in path:
+        return BABY_PINK
+    elif maze[y][x] == 1:
+        return ROSE
+    else:
+        return WHITE
+
+def draw_maze(renderer, maze, path, current=None, solution_path=None, cells=None):
+    # Repaint only the given cells (all of them by default); the renderer
+    # skips any whose color did not change
+    if cells is None:
+        cells = [(x, y) for y in range(ROWS) for x in range(COLS)]
+    for x, y in cells:
+        renderer.paint(x, y, cell_color(maze, x, y, path, current, solution_path))
+
+def _animate(renderer, scheduler, maze, algo, steps):
+    draw_maze(renderer, maze, set())
+    previous = []
+
+    def on_step(current, explored):
+        # Each expansion only changes the previous and the new current cell
+        draw_maze(renderer, maze, explored, current=current, cells=previous + [current])
+        previous[:] = [current]
+
+    trace = SearchTrace(algo, maze)
+    result = scheduler.run(steps, on_step, renderer.flush, trace)
+    trace.finish(result)
+    return result
+
+def a_star_solve(renderer, scheduler, maze):
+    result = _animate(renderer, scheduler, maze, 'astar', maze_core.a_star_steps(maze, directions=DIRECTIONS))
+    if result.path:
+        print("Maze Solved with A*!")
+    return result.path
+
+def bidirectional_a_star_solve(renderer, scheduler, maze):
+    result = _animate(renderer, scheduler, maze, 'biastar', maze_core.bidirectional_a_star_steps(maze, directions=DIRECTIONS))
+    if result.path:
+        print("Maze Solved with Bidirectional A*!")
+    return result.path
+
+def jps_solve(renderer, scheduler, maze):
+    result = _animate(renderer, scheduler, maze, 'jps', maze_core.jps_steps(maze, directions=DIRECTIONS))
+    if result.path:
+        print("Maze Solved with Jump Point Search!")
+    return result.path
+
+def greedy_solve(renderer, scheduler, maze):
+    result = _animate(renderer, scheduler, maze, 'greedy', maze_core.greedy_steps(maze, directions=DIRECTIONS))
+    if result.path:
+        print("Maze Solved with Greedy Search!")
+    return result.path
 
 def main():
     pygame.init()
+    if TRACE:
+        add_hook(json_lines())
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("Helal's Maze - Rose Theme")
+    renderer = MazeRenderer(screen, ROWS, COLS, CELL_SIZE, inset=1)
+    scheduler = StepScheduler(fps=20)  # One step per frame matches the old 50 ms delay
 
-    maze = generate_maze(ROWS, COLS)
+    maze = generate_maze(ROWS, COLS, OBSTACLES)
 
     # Toggle between algorithms here
     use_astar = True   # Set False to use Greedy instead
-
-    if use_astar:
-        solution_path = a_star_solve(screen, maze)
+    use_jps = False    # With use_astar, jump between jump points instead of cells
+    use_bidirectional = False  # With use_astar, also search back from the goal
+
+    if use_astar and use_jps:
+        solution_path = jps_solve(renderer, scheduler, maze)
+    elif use_astar and use_bidirectional:
+        solution_path = bidirectional_a_star_solve(renderer, scheduler, maze)
+    elif use_astar:
+        solution_path = a_star_solve(renderer, scheduler, maze)
     else:
-        solution_path = greedy_solve(screen, maze)
+        solution_path = greedy_solve(renderer, scheduler, maze)
 
-    draw_maze(screen, maze, path=[], solution_path=solution_path)
-    pygame.display.flip()
+    draw_maze(renderer, maze, path=set(), solution_path=set(solution_path or ()))
+    renderer.flush()
 
     running = True
     while running:
@@ -1,11 +1,18 @@
 import pygame
-import random
-import time
+
+import maze_core
+from maze_core.generators import generate_maze
+from maze_core.render import MazeRenderer
+from maze_core.scheduler import StepScheduler
+from maze_core.trace import SearchTrace, add_hook, json_lines
 
 # Maze settings
 WIDTH, HEIGHT = 400, 400
 ROWS, COLS = 5, 5
 CELL_SIZE = WIDTH // COLS
+OBSTACLES = (ROWS * COLS) // 8  # Random wall cells added on top of the open grid
+USE_IDA_STAR = False  # Deepen a Manhattan f bound instead of the depth limit
+TRACE = True  # Print a JSON record of search counters after every solve
 
 # Colors - Neon Theme
 BACKGROUND = (10, 10, 30)
@@ -16,67 +23,36 @@ START = (0, 255, 128)  # Neon Green
 END = (255, 128, 0)  # Neon Orange
 VISITED = (80, 0, 120)  # Dark Purple
 
-# Directions (Right, Down, Left, Up)
-DIRECTIONS = [(1, 0), (0, 1), (-1, 0), (0, -1)]
-
-
-def generate_maze(rows, cols):
-    maze = [[1] * cols for _ in range(rows)]
-    stack = [(0, 0)]
-    visited = set(stack)
-
-    while stack:
-        x, y = stack[-1]
-        neighbors = [(x + dx, y + dy) for dx, dy in DIRECTIONS
-                     if 0 <= x + dx < cols and 0 <= y + dy < rows]
-        unvisited_neighbors = [(nx, ny) for nx, ny in neighbors if (nx, ny) not in visited]
-
-        if unvisited_neighbors:
-            nx, ny = random.choice(unvisited_neighbors)
-            maze[y][x] = 0
-            maze[ny][nx] = 0
-            stack.append((nx, ny))
-            visited.add((nx, ny))
-        else:
-            stack.pop()
-
-    # Add random obstacles (about 20% of the free cells)
-    for _ in range((rows * cols) // 8):
-        while True:
-            ox, oy = random.randint(0, cols - 1), random.randint(0, rows - 1)
-            if (ox, oy) not in [(0, 0), (cols - 1, rows - 1)] and \
-                    (ox, oy) not in [(0, 1), (1, 0), (cols - 2, rows - 1), (cols - 1, rows - 2)]:
-                maze[oy][ox] = 1
-                break
-
-    return maze
 
-
-def draw_maze(screen, maze, path=None, visited=None, current=None):
+def cell_color(maze, x, y, path, visited, current=None):
+    if (x, y) == (0, 0):
+        return START  # Start position
+    elif (x, y) == (COLS - 1, ROWS - 1):
+        return END  # End position
+    elif (x, y) == current:
+        return CURRENT  # Node being processed
+    elif (x, y) in path:
+        return PATH  # Final path
+    elif (x, y) in visited:
+        return VISITED  # Visited cells
+    elif maze[y][x] == 1:
+        return WALL  # Obstacle
+    else:
+        return BACKGROUND  # Open space
+
+
+def draw_maze(renderer, maze, path=None, visited=None, current=None, cells=None):
     if path is None:
         path = set()
     if visited is None:
         visited = set()
 
-    for y in range(ROWS):
-        for x in range(COLS):
-            if (x, y) == (0, 0):
-                color = START  # Start position
-            elif (x, y) == (COLS - 1, ROWS - 1):
-                color = END  # End position
-            elif (x, y) == current:
-                color = CURRENT  # Node being processed
-            elif (x, y) in path:
-                color = PATH  # Final path
-            elif (x, y) in visited:
-                color = VISITED  # Visited cells
-            elif maze[y][x] == 1:
-                color = WALL  # Obstacle
-            else:
-                color = BACKGROUND  # Open space
-            pygame.draw.rect(screen, color, (x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE))
-            # Add grid lines
-            pygame.draw.rect(screen, BACKGROUND, (x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE), 1)
+    # Repaint only the given cells (all of them by default); the renderer
+    # skips any whose color did not change
+    if cells is None:
+        cells = [(x, y) for y in range(ROWS) for x in range(COLS)]
+    for x, y in cells:
+        renderer.paint(x, y, cell_color(maze, x, y, path, visited, current))
 
 
 def draw_text(screen, text, x, y):
@@ -85,101 +61,90 @@ def draw_text(screen, text, x, y):
     screen.blit(text_surface, (x, y))
 
 
-def dls_solve(screen, maze, depth_limit, visualize=True):
-    start = (0, 0)
-    goal = (COLS - 1, ROWS - 1)
-
-    # Stack contains (path, current_position, current_depth)
-    stack = [([start], start, 0)]
-    visited = set([start])
-    all_visited = set([start])  # Track all visited cells for visualization
-
-    while stack:
-        current_path, (x, y), depth = stack.pop()
-
-        # Update screen if visualizing
-        if visualize:
-            draw_maze(screen, maze, set(current_path), all_visited, current=(x, y))
-            draw_text(screen, f"Depth Limit: {depth_limit}", 10, HEIGHT - 40)
-            pygame.display.flip()
-            pygame.time.delay(50)  # Animation delay
-
-            # Check for quit event
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    return None
-
-        if (x, y) == goal:
-            return current_path  # Final path to goal
-
-        # If we've reached the depth limit, don't explore further from this node
-        if depth >= depth_limit:
-            continue
-
-        # Check neighbors
-        for dx, dy in DIRECTIONS[::-1]:
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < COLS and 0 <= ny < ROWS and maze[ny][nx] == 0 and (nx, ny) not in visited:
-                visited.add((nx, ny))
-                all_visited.add((nx, ny))
-                stack.append((current_path + [(nx, ny)], (nx, ny), depth + 1))
-
-    return None  # No solution found
-
-
-def ids_solve(screen, maze, max_depth):
+def ids_solve(renderer, scheduler, maze, max_depth):
     """Iterative Deepening Search"""
-    for depth_limit in range(1, max_depth + 1):
-        # Clear screen for new iteration
-        screen.fill(BACKGROUND)
-        draw_text(screen, f"IDS - Trying Depth: {depth_limit}", 10, 10)
-        pygame.display.flip()
-        pygame.time.delay(500)  # Pause between depth iterations
-
-        path = dls_solve(screen, maze, depth_limit)
-
-        if path:
-            return path, depth_limit
-
-    return None, max_depth
+    screen = renderer.screen
+    state = {'depth_limit': 0, 'previous': [], 'explored': set()}
+    name = "IDA*" if USE_IDA_STAR else "IDS"
+    # Cells under the depth label are repainted with it so the text does not
+    # smear over itself
+    label_cells = renderer.cells_in((0, HEIGHT - 40, WIDTH, 40))
+
+    def on_iteration(depth_limit):
+        # IDS carries on from the cells the last limit stopped at and keeps
+        # its explored cells; IDA* starts over, so its cells are cleared
+        state['depth_limit'] = depth_limit
+        state['previous'] = []
+        draw_maze(renderer, maze, visited=state['explored'])
+
+    def on_step(current, explored):
+        cells = state['previous'] + [current]
+        draw_maze(renderer, maze, visited=explored, current=current, cells=cells)
+        state['previous'] = [current]
+        state['explored'] = explored
+
+    def on_frame():
+        renderer.invalidate(label_cells)
+        current = state['previous'][0] if state['previous'] else None
+        draw_maze(renderer, maze, visited=state['explored'], current=current, cells=label_cells)
+        draw_text(screen, f"{name} Depth Limit: {state['depth_limit']}", 10, HEIGHT - 40)
+        renderer.flush()
+
+    trace = SearchTrace('idastar' if USE_IDA_STAR else 'ids', maze)
+    on_iteration = trace.timed(on_iteration)
+    if USE_IDA_STAR:
+        steps = maze_core.ida_star_steps(maze, on_iteration=on_iteration)
+    else:
+        steps = maze_core.ids_steps(maze, max_depth, on_iteration=on_iteration)
+    result, found_depth = scheduler.run(steps, on_step, on_frame, trace)
+    trace.finish(result, depth_limit=found_depth)
+    return result.path, found_depth
 
 
 def main():
     pygame.init()
+    if TRACE:
+        add_hook(json_lines())
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("Neon Maze Solver - IDS")
+    renderer = MazeRenderer(screen, ROWS, COLS, CELL_SIZE, grid_color=BACKGROUND)
+    scheduler = StepScheduler(fps=20)  # One step per frame matches the old 50 ms delay
 
     # Maximum depth for IDS (Manhattan distance + some extra)
     max_depth = ROWS + COLS + 10
 
-    maze = generate_maze(ROWS, COLS)
+    maze = generate_maze(ROWS, COLS, OBSTACLES)
     screen.fill(BACKGROUND)
 
-    path, found_depth = ids_solve(screen, maze, max_depth)
+    path, found_depth = ids_solve(renderer, scheduler, maze, max_depth)
 
     running = True
+    redraw = True
     message = f"Solved with IDS! (Found at depth: {found_depth})" if path else "No Solution Found!"
 
     while running:
-        screen.fill(BACKGROUND)
+        if redraw:
+            screen.fill(BACKGROUND)
+            renderer.invalidate()
 
-        if path:
-            draw_maze(screen, maze, set(path))
-        else:
-            draw_maze(screen, maze)
+            if path:
+                draw_maze(renderer, maze, set(path))
+            else:
+                draw_maze(renderer, maze)
 
-        draw_text(screen, message, 10, HEIGHT - 40)
-        pygame.display.flip()
+            draw_text(screen, message, 10, HEIGHT - 40)
+            pygame.display.flip()
+            redraw = False
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_r:  # Press R to regenerate maze
-                    maze = generate_maze(ROWS, COLS)
-                    path, found_depth = ids_solve(screen, maze, max_depth)
+                    maze = generate_maze(ROWS, COLS, OBSTACLES)
+                    path, found_depth = ids_solve(renderer, scheduler, maze, max_depth)
                     message = f"Solved with IDS! (Found at depth: {found_depth})" if path else "No Solution Found!"
+                    redraw = True
 
     pygame.quit()
 
@@ -0,0 +1,36 @@
+"""Headless maze search engine shared by the pygame front-ends in ``Maze/``."""
+
+from .fields import FlowField, flow_field
+from .generators import generate_grid, generate_maze
+from .grid import CellMask, Grid, as_grid
+from .solvers import (
+    DIRECTIONS,
+    SearchResult,
+    a_star_solve,
+    a_star_steps,
+    bfs_solve,
+    bfs_steps,
+    bidirectional_a_star_solve,
+    bidirectional_a_star_steps,
+    bidirectional_bfs_solve,
+    bidirectional_bfs_steps,
+    dfs_solve,
+    dfs_steps,
+    dls_solve,
+    dls_steps,
+    dls_sweep,
+    greedy_solve,
+    greedy_steps,
+    heuristic,
+    ida_star_solve,
+    ida_star_steps,
+    ids_solve,
+    ids_steps,
+    run_steps,
+    ucs_solve,
+    ucs_steps,
+)
+from .genetic import genetic_solve, genetic_steps
+from .hpa import build_hierarchy, hpa_solve
+from .incremental import DStarLite
+from .jps import jps_solve, jps_steps
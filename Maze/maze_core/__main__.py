@@ -0,0 +1,150 @@
+"""Run any registered maze solver from one command.
+
+Run from the ``Maze/`` directory::
+
+    python -m maze_core --algo astar --size 64 --seed 1
+    python -m maze_core --algo bfs --size 1024 --headless
+    python -m maze_core --algo bfs --size 1024 --record bfs.mzr
+
+Without ``--headless`` the search is animated in a pygame window (``+`` and
+``-`` change the speed, closing the window quits). With it, pygame is never
+imported and the maze is solved at full speed. ``--record`` also solves at
+full speed, without a window, and saves the exploration for
+``python -m maze_core.replay`` (see :mod:`maze_core.recording`). Either way
+the run's counters are printed as one JSON record (see
+:mod:`maze_core.trace`).
+"""
+
+import argparse
+import sys
+import time
+
+from .generators import ALGORITHMS, generate_grid
+from .recording import record
+from .registry import EVOLVING, SOLVERS, STEPS, seed_options
+from .trace import SearchTrace, json_lines
+
+WINDOW = 800  # Largest side of the window in pixels
+
+# Colors
+OPEN = (235, 235, 235)
+WALL = (40, 40, 40)
+EXPLORED = (150, 190, 230)
+CURRENT = (255, 200, 0)
+SOLUTION = (230, 60, 60)
+START = (40, 170, 60)
+GOAL = (240, 130, 0)
+
+
+def run_headless(grid, algo, trace, seed=None):
+    result = SOLVERS[algo](grid, **seed_options(algo, seed))
+    trace.finish(result)
+    return result
+
+
+def run_recorded(grid, algo, path, trace, seed=None):
+    # Jump point search queues jump points, not neighbours, so its pushes
+    # cannot be derived from the expansions
+    steps = STEPS[algo](grid, **seed_options(algo, seed))
+    result, recording = record(trace.steps(steps), grid, pushes=algo != 'jps')
+    recording.save(path)
+    trace.finish(result, events=len(recording))
+    return result
+
+
+def run_window(grid, algo, fps, trace, seed=None):
+    # Imported here so that headless runs never load pygame
+    import pygame
+
+    from .render import MazeRenderer
+    from .scheduler import StepScheduler
+
+    cell_size = max(WINDOW // max(grid.rows, grid.cols), 1)
+    pygame.init()
+    screen = pygame.display.set_mode((grid.cols * cell_size, grid.rows * cell_size))
+    pygame.display.set_caption(f"{algo} maze solver")
+    renderer = MazeRenderer(screen, grid.rows, grid.cols, cell_size)
+    scheduler = StepScheduler(fps=fps)
+    start, goal = (0, 0), (grid.cols - 1, grid.rows - 1)
+
+    def base_color(cell):
+        if cell == start:
+            return START
+        if cell == goal:
+            return GOAL
+        return OPEN if grid.is_open(*cell) else WALL
+
+    for y in range(grid.rows):
+        for x in range(grid.cols):
+            renderer.paint(x, y, base_color((x, y)))
+    renderer.flush()
+    previous = []
+
+    def on_expand(current, explored):
+        for cell in previous:
+            renderer.paint(*cell, base_color(cell) if cell in (start, goal) else EXPLORED)
+        renderer.paint(*current, CURRENT)
+        previous[:] = [current]
+
+    def on_generation(generation, best_score, path_coords):
+        for cell in previous:
+            renderer.paint(*cell, base_color(cell))
+        for cell in path_coords:
+            renderer.paint(*cell, EXPLORED)
+        previous[:] = path_coords
+        pygame.display.set_caption(f"{algo} maze solver - generation {generation}, best score {best_score}")
+
+    trace.started = time.perf_counter()  # Leave out the initial paint
+    options = seed_options(algo, seed)
+    if algo in STEPS:
+        on_step = on_generation if algo in EVOLVING else on_expand
+        result = scheduler.run(STEPS[algo](grid, **options), on_step, renderer.flush, trace)
+    else:
+        result = SOLVERS[algo](grid, **options)
+    trace.finish(result)
+
+    for cell in result.path or ():
+        renderer.paint(*cell, SOLUTION)
+    renderer.flush()
+    status = f"path length {len(result.path) - 1}" if result.path else "no path"
+    pygame.display.set_caption(f"{algo} maze solver - {status}, {result.expanded} expanded")
+
+    while True:
+        event = pygame.event.wait()
+        if event.type == pygame.QUIT:
+            break
+    pygame.quit()
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m maze_core', description=__doc__.splitlines()[0])
+    parser.add_argument('--algo', choices=list(SOLVERS), default='bfs')
+    parser.add_argument('--size', type=int, default=15, help="rows and columns of the maze")
+    parser.add_argument('--seed', type=int, help="maze seed, also used by random solvers; random when omitted")
+    parser.add_argument('--maze', choices=ALGORITHMS, default='open', help="maze generator")
+    parser.add_argument('--density', type=int, default=8,
+                        help="obstacle divisor: (size * size) // D random walls, 0 for none")
+    parser.add_argument('--headless', action='store_true', help="solve without opening a window")
+    parser.add_argument('--fps', type=int, default=30, help="animation frames per second")
+    parser.add_argument('--record', metavar='FILE', help="solve without a window and save the exploration to FILE")
+    args = parser.parse_args(argv)
+    if args.size < 3:
+        parser.error("--size must be at least 3")
+    if args.record and (args.algo not in STEPS or args.algo in EVOLVING):
+        parser.error(f"--record needs a search that expands cells, not {args.algo}")
+
+    obstacles = (args.size * args.size) // args.density if args.density else 0
+    grid = generate_grid(args.size, args.size, obstacles, args.seed, args.maze)
+    trace = SearchTrace(args.algo, grid, [json_lines()], seed=args.seed, generator=args.maze)
+    if args.record:
+        result = run_recorded(grid, args.algo, args.record, trace, args.seed)
+    elif args.headless:
+        result = run_headless(grid, args.algo, trace, args.seed)
+    else:
+        result = run_window(grid, args.algo, args.fps, trace, args.seed)
+    return 0 if result.path else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,147 @@
+"""Headless benchmark of every maze solver across sizes and obstacle densities.
+
+Run from the ``Maze/`` directory::
+
+    python -m maze_core.benchmark --sizes 15 64 256 --seeds 0 1 2 -o bench.json
+
+Each case generates a seeded maze, solves it (random solvers with the same
+seed) and records wall time, nodes expanded and generated, peak frontier size,
+peak RSS and the path length against the BFS optimum. By default every case
+runs in its own short-lived worker process so ``peak_rss_kb`` belongs to that
+case alone. The report is a single JSON document that can be diffed between
+releases.
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import resource
+import sys
+import time
+
+from .generators import generate_grid
+from .registry import SOLVERS, seed_options
+from .solvers import bfs_solve
+
+# Above these sizes a single case takes minutes, so they are skipped unless
+# --max-size overrides it
+SIZE_CAPS = {'idastar': 128, 'genetic': 64}
+
+DEFAULT_SIZES = [15, 64, 256, 1024, 2048]
+# Obstacle counts used by the GUI scripts: (rows * cols) // divisor
+DEFAULT_DENSITIES = [8, 5, 4]
+
+
+def _peak_rss_kb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux kilobytes
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def bfs_optimum(size, density, seed):
+    """BFS path length of a case's maze, or None if it has no path."""
+    path = bfs_solve(generate_grid(size, size, (size * size) // density, seed)).path
+    return len(path) - 1 if path else None
+
+
+def run_case(solver, size, density, seed, optimal_length=None):
+    # The optimum comes from a separate task, so the BFS behind it does
+    # not count towards this worker's peak RSS. Random solvers get the case
+    # seed too, so that every row can be reproduced
+    grid = generate_grid(size, size, (size * size) // density, seed)
+
+    start = time.perf_counter()
+    result = SOLVERS[solver](grid, **seed_options(solver, seed))
+    elapsed = time.perf_counter() - start
+
+    path_length = len(result.path) - 1 if result.path else None
+    return {
+        'solver': solver,
+        'size': size,
+        'density': density,
+        'seed': seed,
+        'solved': result.path is not None,
+        'wall_time_s': round(elapsed, 6),
+        'nodes_expanded': result.expanded,
+        'nodes_generated': result.generated,
+        'peak_frontier': result.max_frontier,
+        'peak_rss_kb': _peak_rss_kb(),
+        'path_length': path_length,
+        'optimal_length': optimal_length,
+        'path_ratio': round(path_length / optimal_length, 4) if path_length and optimal_length else None,
+    }
+
+
+def _over_cap(solver, size, max_size):
+    # --max-size replaces the caps of the capped solvers; the others have none
+    cap = SIZE_CAPS.get(solver)
+    if cap and max_size:
+        cap = max_size
+    return cap is not None and size > cap
+
+
+def run_benchmark(solvers, sizes, densities, seeds, max_size=None, isolate=True, log=None):
+    # maxtasksperchild=1 gives every case a fresh worker, so ru_maxrss in the
+    # worker is that case's own peak
+    pool = multiprocessing.get_context('spawn').Pool(1, maxtasksperchild=1) if isolate else None
+    results = []
+    try:
+        for size in sizes:
+            for density in densities:
+                for seed in seeds:
+                    runnable = [solver for solver in solvers if not _over_cap(solver, size, max_size)]
+                    if not runnable:
+                        continue
+                    maze = (size, density, seed)
+                    optimal = pool.apply(bfs_optimum, maze) if pool else bfs_optimum(*maze)
+                    for solver in runnable:
+                        args = (solver, size, density, seed, optimal)
+                        record = pool.apply(run_case, args) if pool else run_case(*args)
+                        results.append(record)
+                        if log:
+                            log(record)
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+    return {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'isolated': isolate,
+        },
+        'results': results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--solvers', nargs='+', choices=list(SOLVERS), default=list(SOLVERS))
+    parser.add_argument('--sizes', nargs='+', type=int, default=DEFAULT_SIZES)
+    parser.add_argument('--densities', nargs='+', type=int, default=DEFAULT_DENSITIES,
+                        help="obstacle divisors: (rows * cols) // D random walls")
+    parser.add_argument('--seeds', nargs='+', type=int, default=[0])
+    parser.add_argument('--max-size', type=int, help="override the per-solver size caps")
+    parser.add_argument('--no-isolate', dest='isolate', action='store_false',
+                        help="run cases in this process (peak RSS becomes cumulative)")
+    parser.add_argument('-o', '--output', help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    def log(record):
+        print(f"{record['solver']:>8} {record['size']:>5} //{record['density']} seed={record['seed']}: "
+              f"{record['wall_time_s']:.4f}s expanded={record['nodes_expanded']}", file=sys.stderr)
+
+    report = run_benchmark(args.solvers, args.sizes, args.densities, args.seeds,
+                           args.max_size, args.isolate, log)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+
+if __name__ == '__main__':
+    main()
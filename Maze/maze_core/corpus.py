@@ -0,0 +1,169 @@
+"""Binary maze and maze-corpus files.
+
+A corpus file is a 16-byte file header followed by one record per maze::
+
+    file header   <4sHHII   magic b'MAZC', version, flags, record count, reserved
+    record header <IIqiiiiI rows, cols, seed (-1 if unknown),
+                            start x, start y, goal x, goal y, payload size
+    payload       the cells, then the step costs if the maze has terrain
+
+By default the cells are the padded ``Grid.cells`` buffer byte for byte, so
+:class:`MazeCorpus` can memory-map the file and hand each solver a ``Grid``
+whose cells are a zero-copy view into the mapping. With ``packed=True`` they
+are the unpadded rows at one bit per cell (wall = 1), eight times smaller but
+unpacked into a fresh Grid on access.
+
+A maze with weighted terrain has its padded ``Grid.weights`` buffer
+appended to the cells, so its payload is longer than the cells alone; the
+file header flag ``FLAG_WEIGHTS`` is set when any record has one.
+"""
+
+import mmap
+import struct
+from collections import namedtuple
+
+from .grid import Grid
+
+MAGIC = b'MAZC'
+VERSION = 1
+FLAG_PACKED = 0x1
+FLAG_WEIGHTS = 0x2  # At least one record carries step costs
+
+_FILE_HEADER = struct.Struct('<4sHHII')
+_RECORD_HEADER = struct.Struct('<IIqiiiiI')
+
+# Cell byte -> ASCII bit, and back
+_WALL_BITS = bytes([ord('0')] + [ord('1')] * 255)
+_BIT_CELLS = bytes.maketrans(b'01', b'\x00\x01')
+
+MazeRecord = namedtuple('MazeRecord', ['grid', 'seed', 'start', 'goal'])
+MazeRecord.__new__.__defaults__ = (None, None, None)
+
+
+def _pack(grid):
+    width, cols = grid.width, grid.cols
+    rows = b''.join(grid.cells[(y + 1) * width + 1:(y + 1) * width + 1 + cols] for y in range(grid.rows))
+    count = grid.rows * cols
+    if not count:
+        return b''
+    # Bit i of the little-endian payload is cell i
+    return int(rows.translate(_WALL_BITS)[::-1], 2).to_bytes((count + 7) // 8, 'little')
+
+
+def _unpack(payload, rows, cols):
+    count = rows * cols
+    bits = format(int.from_bytes(payload, 'little'), f'0{count}b')[::-1]
+    cells = bits.encode('ascii').translate(_BIT_CELLS)
+    grid = Grid(rows, cols)
+    width = grid.width
+    for y in range(rows):
+        grid.cells[(y + 1) * width + 1:(y + 1) * width + 1 + cols] = cells[y * cols:(y + 1) * cols]
+    return grid
+
+
+def write_corpus(path, records, packed=False):
+    """Write an iterable of :class:`MazeRecord` (or bare Grids) to ``path``.
+
+    Returns the number of mazes written. Step costs of weighted grids are
+    stored byte for byte after the cells, packed or not.
+    """
+    count = 0
+    flags = FLAG_PACKED if packed else 0
+    with open(path, 'wb') as f:
+        f.write(_FILE_HEADER.pack(MAGIC, VERSION, flags, 0, 0))
+        for record in records:
+            if isinstance(record, Grid):
+                record = MazeRecord(record)
+            grid = record.grid
+            start = record.start or (0, 0)
+            goal = record.goal or (grid.cols - 1, grid.rows - 1)
+            payload = _pack(grid) if packed else grid.cells
+            weights = grid.weights if grid.weights is not None else b''
+            if weights:
+                flags |= FLAG_WEIGHTS
+            f.write(_RECORD_HEADER.pack(grid.rows, grid.cols, -1 if record.seed is None else record.seed,
+                                        start[0], start[1], goal[0], goal[1], len(payload) + len(weights)))
+            f.write(payload)
+            f.write(weights)
+            count += 1
+        # The count is only known at the end
+        f.seek(0)
+        f.write(_FILE_HEADER.pack(MAGIC, VERSION, flags, count, 0))
+    return count
+
+
+def save_maze(path, grid, seed=None, start=None, goal=None, packed=False):
+    write_corpus(path, [MazeRecord(grid, seed, start, goal)], packed)
+
+
+def load_maze(path):
+    """Read the first maze of a file into memory (no mapping is kept)."""
+    with MazeCorpus(path) as corpus:
+        record = corpus[0]
+        grid = record.grid
+        weights = bytearray(grid.weights) if grid.weights is not None else None
+        return record._replace(grid=Grid(grid.rows, grid.cols, bytearray(grid.cells), weights))
+
+
+class MazeCorpus:
+    """Memory-mapped, random-access view of a corpus file.
+
+    Opening walks the record headers once to build an offset table; no cells
+    are read. Grids returned by indexing share memory with the mapping and
+    are only valid until :meth:`close`.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+
+        magic, version, flags, count, _ = _FILE_HEADER.unpack_from(self._view, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a maze corpus file")
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"Unsupported maze corpus version {version}")
+        self.packed = bool(flags & FLAG_PACKED)
+
+        self._offsets = []
+        offset = _FILE_HEADER.size
+        for _ in range(count):
+            self._offsets.append(offset)
+            payload_size = _RECORD_HEADER.unpack_from(self._view, offset)[-1]
+            offset += _RECORD_HEADER.size + payload_size
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __getitem__(self, index):
+        offset = self._offsets[index]
+        rows, cols, seed, sx, sy, gx, gy, size = _RECORD_HEADER.unpack_from(self._view, offset)
+        payload = self._view[offset + _RECORD_HEADER.size:offset + _RECORD_HEADER.size + size]
+        # Anything after the cells is the step costs
+        cells_size = (rows * cols + 7) // 8 if self.packed else (rows + 2) * (cols + 2)
+        grid = _unpack(payload[:cells_size], rows, cols) if self.packed else Grid(rows, cols, payload[:cells_size])
+        if size > cells_size:
+            weights = payload[cells_size:]
+            grid.weights = bytearray(weights) if self.packed else weights
+        return MazeRecord(grid, None if seed < 0 else seed, (sx, sy), (gx, gy))
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def close(self):
+        self._view.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Grids handed out still point into the mapping; it is unmapped
+            # once the last of them is garbage collected
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,115 @@
+"""Goal-rooted distance and flow fields shared by every start cell.
+
+A field is one search run backwards from the goal until every cell that can
+reach it is settled. It records, for each cell, the cost of the cheapest path
+to the goal and the next cell along that path. Any number of agents heading
+for the same goal can then share one field: the distance from a cell and its
+next step are single lookups, and a whole path is followed in O(path length)
+without searching again.
+
+Fields are kept in a small LRU keyed by maze content and goal, so asking for
+the same field twice, even with a freshly built grid, reuses the first one.
+Costs honour weighted terrain the same way :func:`~maze_core.solvers.ucs_solve`
+does: a step costs the weight of the cell it steps onto.
+"""
+
+import hashlib
+from collections import OrderedDict
+
+from .grid import UNREACHED_COST, as_grid
+from .solvers import DIRECTIONS, SearchResult, _ucs, run_steps
+
+# Fields kept for reuse, most recently used last
+FIELD_CACHE_SIZE = 16
+_field_cache = OrderedDict()
+
+
+class FlowField:
+    """Distances to one goal and the next step towards it from every cell.
+
+    ``dist`` and ``next`` are flat arrays indexed like ``grid.cells``. Walls
+    and cells that cannot reach the goal have a distance of
+    ``UNREACHED_COST`` and a next step of -1, as does the goal itself.
+    """
+
+    __slots__ = ('grid', 'goal', 'target', 'dist', 'next', 'expanded')
+
+    def __init__(self, grid, goal, dist, next_cell, expanded):
+        self.grid = grid
+        self.goal = goal
+        self.target = grid.index(*goal)
+        self.dist = dist
+        self.next = next_cell
+        self.expanded = expanded  # Cells settled while building the field
+
+    def _flat(self, cell):
+        x, y = cell
+        if not (0 <= x < self.grid.cols and 0 <= y < self.grid.rows):
+            raise ValueError(f"cell {cell} is outside the maze")
+        return self.grid.index(x, y)
+
+    def distance(self, cell):
+        """Cost of the cheapest path from ``cell`` to the goal, or None."""
+        d = self.dist[self._flat(cell)]
+        return None if d == UNREACHED_COST else d
+
+    def next_step(self, cell):
+        """The cell to move to from ``cell``, or None at the goal or when cut off."""
+        j = self.next[self._flat(cell)]
+        return None if j < 0 else self.grid.coords(j)
+
+    def path(self, start):
+        """Cheapest ``(x, y)`` path from ``start`` to the goal, or None."""
+        i = self._flat(start)
+        if self.dist[i] == UNREACHED_COST:
+            return None
+        coords, next_cell = self.grid.coords, self.next
+        path = [coords(i)]
+        while i != self.target:
+            i = next_cell[i]
+            path.append(coords(i))
+        return path
+
+
+def _build(grid, target, directions):
+    # The Dial search behind ucs_solve, run backwards from the goal with no
+    # cell to stop at, so every cell that can reach the goal is settled
+    result = SearchResult()
+    dist, next_cell = run_steps(_ucs(grid, target, -1, directions, result, None, backward=True))
+    return dist, next_cell, result.expanded
+
+
+def _content_key(grid, goal, directions):
+    digest = hashlib.blake2b(grid.cells, digest_size=16)
+    if grid.weights is not None:
+        digest.update(grid.weights)
+    return grid.rows, grid.cols, goal, tuple(directions), digest.digest()
+
+
+def flow_field(maze, goal=None, directions=DIRECTIONS, cache=True):
+    """The :class:`FlowField` towards ``goal`` (bottom-right by default).
+
+    Built on first use and then served from the LRU until
+    ``FIELD_CACHE_SIZE`` other fields have been asked for since. With
+    ``cache`` false the field is built afresh and not kept.
+    """
+    grid = as_grid(maze)
+    if goal is None:
+        goal = (grid.cols - 1, grid.rows - 1)
+    if not cache:
+        return FlowField(grid, goal, *_build(grid, grid.index(*goal), directions))
+    key = _content_key(grid, goal, directions)
+    field = _field_cache.get(key)
+    if field is not None:
+        _field_cache.move_to_end(key)
+        return field
+
+    dist, next_cell, expanded = _build(grid, grid.index(*goal), directions)
+    field = _field_cache[key] = FlowField(grid, goal, dist, next_cell, expanded)
+    if len(_field_cache) > FIELD_CACHE_SIZE:
+        _field_cache.popitem(last=False)
+    return field
+
+
+def clear_field_cache():
+    _field_cache.clear()
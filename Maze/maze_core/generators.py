@@ -0,0 +1,217 @@
+"""Maze generators, all writing straight into a :class:`~maze_core.grid.Grid`.
+
+``algorithm`` picks the base layout:
+
+* ``'open'`` - every cell open. This is what the original per-script
+  ``generate_maze`` produced: its recursive backtracker stepped one cell at a
+  time, so it carved out the whole grid and only the random obstacles mattered.
+* ``'backtracker'``, ``'kruskal'``, ``'eller'`` - perfect mazes. Cells sit on
+  even coordinates and the odd rows/columns between them are walls, with one
+  passage opened per spanning-tree edge.
+
+Random obstacles are then sprinkled on top, never on the start, the goal or
+the cells next to them. ``terrain`` optionally scatters weighted cells (see
+``TERRAIN_COSTS``) over what is left open. Every generator takes a ``seed`` and draws from its own
+``random.Random``, so the same arguments always give the same maze.
+"""
+
+import random
+from array import array
+
+from .grid import Grid
+
+ALGORITHMS = ('open', 'backtracker', 'kruskal', 'eller')
+
+# Step costs of the terrain types scattered by ``terrain``: mud and water
+TERRAIN_COSTS = (3, 5)
+
+
+def _open_cell(grid, x, y):
+    grid.cells[grid.index(x, y)] = 0
+
+
+def _carve_backtracker(grid, rng, lattice_cols, lattice_rows):
+    # Iterative DFS over lattice cells, with the stack and visited flags in
+    # flat arrays instead of lists of tuples
+    visited = bytearray(lattice_cols * lattice_rows)
+    stack = array('i', [0])
+    visited[0] = 1
+    _open_cell(grid, 0, 0)
+
+    while stack:
+        cell = stack[-1]
+        cx, cy = cell % lattice_cols, cell // lattice_cols
+        options = []
+        if cx + 1 < lattice_cols and not visited[cell + 1]:
+            options.append(cell + 1)
+        if cx > 0 and not visited[cell - 1]:
+            options.append(cell - 1)
+        if cy + 1 < lattice_rows and not visited[cell + lattice_cols]:
+            options.append(cell + lattice_cols)
+        if cy > 0 and not visited[cell - lattice_cols]:
+            options.append(cell - lattice_cols)
+
+        if not options:
+            stack.pop()
+            continue
+        nxt = options[rng.randrange(len(options))] if len(options) > 1 else options[0]
+        nx, ny = nxt % lattice_cols, nxt // lattice_cols
+        _open_cell(grid, cx + nx, cy + ny)  # Passage between the two cells
+        _open_cell(grid, 2 * nx, 2 * ny)
+        visited[nxt] = 1
+        stack.append(nxt)
+
+
+def _open_lattice_row(grid, cy, lattice_cols):
+    start = grid.index(0, 2 * cy)
+    grid.cells[start:start + 2 * lattice_cols:2] = bytes(lattice_cols)
+
+
+def _carve_kruskal(grid, rng, lattice_cols, lattice_rows):
+    for cy in range(lattice_rows):
+        _open_lattice_row(grid, cy, lattice_cols)
+
+    # Edge e < count joins cell e with the one to its right, the rest join
+    # cell e - count with the one below it
+    count = lattice_cols * lattice_rows
+    edges = [c for c in range(count) if c % lattice_cols + 1 < lattice_cols]
+    edges += range(count, 2 * count - lattice_cols)
+    rng.shuffle(edges)
+
+    parent = array('i', range(count))
+    cells, width = grid.cells, grid.width
+
+    for edge in edges:
+        if edge < count:
+            a, b, step = edge, edge + 1, 1
+        else:
+            a = edge - count
+            b, step = a + lattice_cols, width
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]  # Path halving
+            a = parent[a]
+        while parent[b] != b:
+            parent[b] = parent[parent[b]]
+            b = parent[b]
+        if a != b:
+            parent[b] = a
+            cell = edge if edge < count else edge - count
+            # Open the wall just right of / below the lattice cell
+            cells[(2 * (cell // lattice_cols) + 1) * width + 2 * (cell % lattice_cols) + 1 + step] = 0
+
+
+def _carve_eller(grid, rng, lattice_cols, lattice_rows):
+    # Only the set id of each column in the current row is kept, so memory is
+    # O(cols) no matter how tall the maze is
+    ids = list(range(lattice_cols))
+    next_id = lattice_cols
+
+    for cy in range(lattice_rows):
+        _open_lattice_row(grid, cy, lattice_cols)
+        members = {}
+        for cx, set_id in enumerate(ids):
+            members.setdefault(set_id, []).append(cx)
+
+        last = cy == lattice_rows - 1
+        for cx in range(lattice_cols - 1):
+            a, b = ids[cx], ids[cx + 1]
+            if a != b and (last or rng.random() < 0.5):
+                _open_cell(grid, 2 * cx + 1, 2 * cy)
+                # Relabel the smaller set
+                if len(members[a]) < len(members[b]):
+                    a, b = b, a
+                for c in members[b]:
+                    ids[c] = a
+                members[a].extend(members.pop(b))
+        if last:
+            break
+
+        # Every set continues downwards through at least one of its cells
+        next_ids = [-1] * lattice_cols
+        for set_id, columns in members.items():
+            keep = rng.choice(columns)
+            for cx in columns:
+                if cx == keep or rng.random() < 0.5:
+                    _open_cell(grid, 2 * cx, 2 * cy + 1)
+                    next_ids[cx] = set_id
+        for cx in range(lattice_cols):
+            if next_ids[cx] < 0:
+                next_ids[cx] = next_id
+                next_id += 1
+        ids = next_ids
+
+
+_CARVERS = {
+    'backtracker': _carve_backtracker,
+    'kruskal': _carve_kruskal,
+    'eller': _carve_eller,
+}
+
+
+def _connect_goal(grid):
+    # With an even width or height the goal corner is off the lattice; join
+    # it to the nearest lattice cell
+    x, y = grid.cols - 1, grid.rows - 1
+    _open_cell(grid, x, y)
+    if x % 2 and y % 2:
+        _open_cell(grid, x - 1, y)
+
+
+def _protected_cells(rows, cols):
+    return {(0, 0), (cols - 1, rows - 1), (0, 1), (1, 0), (cols - 2, rows - 1), (cols - 1, rows - 2)}
+
+
+def _place_obstacles(grid, count, rng):
+    rows, cols, width = grid.rows, grid.cols, grid.width
+    protected = {y * cols + x for x, y in _protected_cells(rows, cols) if 0 <= x < cols and 0 <= y < rows}
+    if len(protected) >= rows * cols:
+        return  # Tiny grid: every cell is next to the start or the goal
+    cells = grid.cells
+    # Draw every position in one batch (with replacement, like the original
+    # loop) and redraw the rare hits on protected cells
+    for p in rng.choices(range(rows * cols), k=count):
+        while p in protected:
+            p = rng.randrange(rows * cols)
+        cells[(p // cols + 1) * width + p % cols + 1] = 1
+
+
+def _place_terrain(grid, count, rng):
+    rows, cols, width = grid.rows, grid.cols, grid.width
+    weights = grid.weights = bytearray(b'\x01') * len(grid.cells)
+    for p in rng.choices(range(rows * cols), k=count):
+        weights[(p // cols + 1) * width + p % cols + 1] = rng.choice(TERRAIN_COSTS)
+
+
+def generate_grid(rows, cols, obstacles=0, seed=None, algorithm='open', terrain=0):
+    """Generate a maze as a :class:`Grid`.
+
+    ``obstacles`` extra wall cells are placed at random after the base layout
+    is built; the same cell may be picked twice. The start, the goal and
+    their neighbours are never walled, so grids with no other cells get
+    none. ``terrain`` cells then get a
+    random cost from ``TERRAIN_COSTS``, which only matters where they are open.
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown maze algorithm {algorithm!r}, expected one of {ALGORITHMS}")
+    rng = random.Random(seed)
+    grid = Grid(rows, cols)
+
+    if algorithm == 'open':
+        width = grid.width
+        for y in range(rows):
+            start = (y + 1) * width + 1
+            grid.cells[start:start + cols] = bytes(cols)
+    else:
+        _CARVERS[algorithm](grid, rng, (cols + 1) // 2, (rows + 1) // 2)
+        _connect_goal(grid)
+
+    if obstacles:
+        _place_obstacles(grid, obstacles, rng)
+    if terrain:
+        _place_terrain(grid, terrain, rng)
+    return grid
+
+
+def generate_maze(rows, cols, obstacles=0, seed=None, algorithm='open', terrain=0):
+    """Same as :func:`generate_grid`, returned as a list of rows."""
+    return generate_grid(rows, cols, obstacles, seed, algorithm, terrain).to_rows()
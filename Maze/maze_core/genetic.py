@@ -0,0 +1,178 @@
+"""Genetic-algorithm maze solver.
+
+Individuals are fixed-length strings of ``'U'/'D'/'L'/'R'`` moves replayed from
+the start; moves into walls or off the grid are ignored. Fitness is minus the
+closest an individual gets to the goal, in true maze distance rather than
+Manhattan distance, so walking into a dead end next to the goal is not
+rewarded. Distances are looked up in the goal's
+:func:`~maze_core.fields.flow_field`, which is cached by maze content, so
+every generation (and every run on the same maze) shares one.
+
+Replays are incremental. Every individual keeps its trace (the position after
+each move), and a child starts from its first parent's trace up to the first
+move that crossover or mutation changed. Traces of recent genomes are also kept
+in a bounded LRU, so exact duplicates are not replayed at all.
+"""
+
+import random
+from collections import OrderedDict
+
+from .fields import flow_field
+from .grid import as_grid
+from .solvers import SearchResult, run_steps
+
+DIR_KEYS = ['U', 'D', 'L', 'R']
+DIR_MAP = {'U': (0, -1), 'D': (0, 1), 'L': (-1, 0), 'R': (1, 0)}
+
+
+def _move_offsets(grid):
+    return {key: dx + dy * grid.width for key, (dx, dy) in DIR_MAP.items()}
+
+
+def evaluate_fitness(maze, moves, start=(0, 0), goal=None):
+    grid = as_grid(maze)
+    if goal is None:
+        goal = (grid.cols - 1, grid.rows - 1)
+    cells = grid.cells
+    offsets = _move_offsets(grid)
+    dist = flow_field(grid, goal).dist
+    i = grid.index(*start)
+    closest = dist[i]
+    for move in moves:
+        j = i + offsets[move]
+        if not cells[j]:
+            i = j
+            closest = min(closest, dist[i])
+    return -closest
+
+
+def generate_individual(length, rng=random):
+    return [rng.choice(DIR_KEYS) for _ in range(length)]
+
+
+def mutate(individual, mutation_rate=0.1, rng=random):
+    return [gene if rng.random() > mutation_rate else rng.choice(DIR_KEYS) for gene in individual]
+
+
+def crossover(parent1, parent2, rng=random):
+    point = rng.randint(1, len(parent1) - 1)
+    return parent1[:point] + parent2[point:]
+
+
+def _breed(parent1, parent2, mutation_rate=0.1, rng=random):
+    # mutate(crossover(parent1, parent2)), also returning how many leading
+    # moves the child is known to share with parent1
+    point = rng.randint(1, len(parent1) - 1)
+    child = parent1[:point] + parent2[point:]
+    shared = len(child) if parent2 is parent1 else point
+    draw = rng.random
+    mutated = [k for k in range(len(child)) if draw() <= mutation_rate]
+    for k in mutated:
+        child[k] = rng.choice(DIR_KEYS)
+    if mutated and mutated[0] < shared:
+        shared = mutated[0]
+    return child, shared
+
+
+def _extend_trace(cells, offsets, moves, trace):
+    # ``trace`` holds the position before the first move and after each of
+    # the moves replayed so far; replay the rest
+    append = trace.append
+    i = trace[-1]
+    for move in moves[len(trace) - 1:]:
+        j = i + offsets[move]
+        if not cells[j]:
+            i = j
+        append(i)
+    return trace
+
+
+def _trace_path(grid, trace, target):
+    # Cells actually visited, stopping at the goal
+    path = [grid.coords(trace[0])]
+    previous = trace[0]
+    for i in trace:
+        if i != previous:
+            path.append(grid.coords(i))
+            previous = i
+            if i == target:
+                break
+    return path
+
+
+def genetic_steps(maze, pop_size=100, generations=100, path_len=None, start=(0, 0), goal=None,
+                  cache_size=None, seed=None):
+    """Evolve move strings until one reaches the goal, one generation per step.
+
+    Yields ``(generation, best_score, path_coords)`` with the cells visited by
+    the best individual and returns the :class:`SearchResult`, whose
+    ``expanded`` counts the moves actually replayed. ``cache_size`` bounds the
+    duplicate-genome LRU (four generations' worth by default). The same
+    ``seed`` evolves the same population on the same maze.
+    """
+    grid = as_grid(maze)
+    if goal is None:
+        goal = (grid.cols - 1, grid.rows - 1)
+    if path_len is None:
+        path_len = 2 * (grid.rows + grid.cols)
+    if cache_size is None:
+        cache_size = 4 * pop_size
+    cells = grid.cells
+    offsets = _move_offsets(grid)
+    source, target = grid.index(*start), grid.index(*goal)
+    dist = flow_field(grid, goal).dist
+    rng = random.Random(seed)
+
+    population = [generate_individual(path_len, rng) for _ in range(pop_size)]
+    # The part of each individual's trace known before replaying it
+    prefixes = [[source] for _ in range(pop_size)]
+    cache = OrderedDict()
+    result = SearchResult()
+
+    for generation in range(generations):
+        traces, scores = [], []
+        for individual, prefix in zip(population, prefixes):
+            key = ''.join(individual)
+            entry = cache.get(key)
+            if entry is None:
+                result.expanded += path_len + 1 - len(prefix)
+                trace = _extend_trace(cells, offsets, individual, prefix)
+                entry = cache[key] = trace, -min(map(dist.__getitem__, trace))
+                if len(cache) > cache_size:
+                    cache.popitem(last=False)
+            else:
+                cache.move_to_end(key)
+            traces.append(entry[0])
+            scores.append(entry[1])
+
+        # Rank by score alone; ties keep population order
+        ranked = sorted(range(pop_size), key=scores.__getitem__, reverse=True)
+        best = ranked[0]
+        path_coords = _trace_path(grid, traces[best], target)
+        yield generation, scores[best], path_coords
+        if path_coords[-1] == goal:
+            result.path = path_coords
+            return result
+
+        top_half = ranked[:pop_size // 2]
+        children, prefixes = [], []
+        for _ in range(pop_size):
+            a, b = rng.choice(top_half), rng.choice(top_half)
+            child, shared = _breed(population[a], population[b], rng=rng)
+            children.append(child)
+            prefixes.append(traces[a][:shared + 1])
+        population = children
+        result.generated += pop_size
+
+    return result
+
+
+def genetic_solve(maze, pop_size=100, generations=100, path_len=None,
+                  start=(0, 0), goal=None, on_generation=None, cache_size=None, seed=None):
+    """Run :func:`genetic_steps` to the end.
+
+    ``on_generation(generation, best_score, path_coords)`` is called once per
+    generation.
+    """
+    steps = genetic_steps(maze, pop_size, generations, path_len, start, goal, cache_size, seed)
+    return run_steps(steps, on_generation)
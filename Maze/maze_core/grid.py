@@ -0,0 +1,128 @@
+"""Compact flat-array maze representation shared by the solvers.
+
+The maze is stored row-major in a ``bytearray`` (one uint8 per cell, ``0`` open
+and ``1`` wall) surrounded by a one-cell wall border. Neighbours of the flat
+index ``i`` are then simply ``i + offset`` for a fixed offset per direction,
+and solvers never need a bounds check: stepping off the grid lands on the
+border, which is a wall like any other.
+
+Weighted terrain (mud, water, ...) is an optional second ``bytearray`` of the
+same shape holding the cost of stepping onto each cell. As a list of rows it
+is written into the open cells: ``0`` is open with cost 1, ``1`` a wall, and
+any larger value an open cell costing that much.
+"""
+
+from array import array
+
+# Cost stored for cells that have not been reached yet
+UNREACHED_COST = 2 ** 31 - 1
+
+# Split a row value into the wall flag and the step cost
+_WALL_TABLE = bytes(1 if value == 1 else 0 for value in range(256))
+_COST_TABLE = bytes(value if value > 1 else 1 for value in range(256))
+
+
+class Grid:
+    __slots__ = ('rows', 'cols', 'width', 'cells', 'weights')
+
+    def __init__(self, rows, cols, cells=None, weights=None):
+        self.rows = rows
+        self.cols = cols
+        self.width = cols + 2
+        if cells is None:
+            cells = bytearray(b'\x01') * (self.width * (rows + 2))
+        self.cells = cells
+        # Per-cell step costs, or None when every step costs 1
+        self.weights = weights
+
+    @classmethod
+    def from_rows(cls, maze):
+        """Build a grid from a list of rows (or a 2-D NumPy array)."""
+        rows, cols = len(maze), len(maze[0])
+        grid = cls(rows, cols)
+        width = grid.width
+        for y, row in enumerate(maze):
+            if hasattr(row, 'tobytes'):
+                row = row.astype('uint8').tobytes()
+            start = (y + 1) * width + 1
+            grid.cells[start:start + cols] = bytes(row)
+        # Anything other than 0 and 1 is terrain; split it out of the walls
+        if grid.cells.translate(None, b'\x00\x01'):
+            grid.weights = bytearray(grid.cells.translate(_COST_TABLE))
+            grid.cells = bytearray(grid.cells.translate(_WALL_TABLE))
+        return grid
+
+    def to_rows(self):
+        width = self.width
+        rows = [list(self.cells[(y + 1) * width + 1:(y + 1) * width + 1 + self.cols]) for y in range(self.rows)]
+        if self.weights is not None:
+            for y, row in enumerate(rows):
+                start = (y + 1) * width + 1
+                for x, cost in enumerate(self.weights[start:start + self.cols]):
+                    if cost > 1 and not row[x]:
+                        row[x] = cost
+        return rows
+
+    def index(self, x, y):
+        return (y + 1) * self.width + x + 1
+
+    def coords(self, index):
+        return index % self.width - 1, index // self.width - 1
+
+    def cost(self, x, y):
+        """Cost of stepping onto ``(x, y)``."""
+        return 1 if self.weights is None else self.weights[self.index(x, y)]
+
+    def is_open(self, x, y):
+        return 0 <= x < self.cols and 0 <= y < self.rows and not self.cells[self.index(x, y)]
+
+    def neighbor_offsets(self, directions):
+        return [dx + dy * self.width for dx, dy in directions]
+
+    def new_mask(self):
+        """Zeroed per-cell flag array, used for visited and closed sets."""
+        return bytearray(len(self.cells))
+
+    def new_parents(self):
+        # Predecessor of each cell as a flat index, -1 when unset
+        return array('i', [-1]) * len(self.cells)
+
+    def new_costs(self):
+        """Per-cell path costs, all starting at ``UNREACHED_COST``."""
+        return array('i', [UNREACHED_COST]) * len(self.cells)
+
+    def path(self, parent, goal):
+        """Rebuild the ``(x, y)`` path ending at flat index ``goal``."""
+        path = []
+        index = goal
+        while index != -1:
+            path.append(self.coords(index))
+            index = parent[index]
+        path.reverse()
+        return path
+
+
+class CellMask:
+    """Read-only ``(x, y) in mask`` view over a per-cell flag array.
+
+    Lets front-ends test membership the way they did with sets of tuples,
+    without the solver building one.
+    """
+
+    __slots__ = ('grid', 'mask')
+
+    def __init__(self, grid, mask):
+        self.grid = grid
+        self.mask = mask
+
+    def __contains__(self, cell):
+        x, y = cell
+        return 0 <= x < self.grid.cols and 0 <= y < self.grid.rows and bool(self.mask[self.grid.index(x, y)])
+
+    def __iter__(self):
+        coords = self.grid.coords
+        return (coords(i) for i, flag in enumerate(self.mask) if flag)
+
+
+def as_grid(maze):
+    return maze if isinstance(maze, Grid) else Grid.from_rows(maze)
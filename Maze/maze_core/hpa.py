@@ -0,0 +1,257 @@
+"""Hierarchical path-finding (HPA*) for large 4-connected, uniform-cost grids.
+
+The grid is cut into square clusters of ``cluster_size`` cells. Wherever two
+neighbouring clusters share a run of open cells along their border, one or
+two pairs of facing cells become entrances. Entrances are the nodes of a
+small abstract graph: facing entrances are joined by a step of cost 1, and
+entrances of the same cluster are joined by their shortest distance inside
+that cluster, found once by a BFS confined to the cluster.
+
+A query only has to connect the start and goal to the entrances of their own
+clusters, run A* over the abstract graph and then refine each abstract edge
+into cells with another cluster-confined search. The work per query depends
+on the path length in clusters, not on the size of the maze.
+
+Paths are not always shortest: they are restricted to pass through the
+chosen entrances, which usually costs a few percent of length.
+"""
+
+import heapq
+from array import array
+from collections import deque
+
+from .grid import as_grid
+from .solvers import DIRECTIONS, SearchResult, _endpoints
+
+# Border runs at least this long get an entrance at each end instead of one
+# in the middle
+WIDE_ENTRANCE = 6
+
+
+class Hierarchy:
+    """Abstract graph of a maze, reusable for any number of queries."""
+
+    __slots__ = ('grid', 'cluster_size', 'cluster_of', 'entrances', 'edges', 'offsets', '_seen', '_stamp')
+
+    def __init__(self, grid, cluster_size):
+        self.grid = grid
+        self.cluster_size = cluster_size
+        self.offsets = grid.neighbor_offsets(DIRECTIONS)
+        # Cluster number of every open cell, -1 on walls and the border
+        self.cluster_of = _label_clusters(grid, cluster_size)
+        # Entrance cells of each cluster, and the abstract edges
+        # {cell: {neighbour: cost}} between entrances
+        self.entrances = {}
+        self.edges = {}
+        # Local searches mark cells with a fresh stamp instead of clearing a
+        # visited array each time
+        self._seen = array('i', [0]) * len(grid.cells)
+        self._stamp = 0
+
+    def _add_edge(self, a, b, cost):
+        self.edges.setdefault(a, {})[b] = cost
+        self.edges.setdefault(b, {})[a] = cost
+
+    def _local_bfs(self, source, targets, parent=None):
+        # BFS from ``source`` that never leaves its cluster. Returns the
+        # distance to each of ``targets`` it reaches and the cells expanded;
+        # ``parent`` (a dict) is filled in when given
+        cluster_of, offsets, seen = self.cluster_of, self.offsets, self._seen
+        self._stamp += 1
+        stamp = self._stamp
+        cluster = cluster_of[source]
+        remaining = set(targets)
+        found = {}
+        seen[source] = stamp
+        level = [source]
+        depth = expanded = 0
+
+        while level and remaining:
+            following = []
+            expanded += len(level)
+            for i in level:
+                if i in remaining:
+                    found[i] = depth
+                    remaining.discard(i)
+                for offset in offsets:
+                    j = i + offset
+                    if cluster_of[j] == cluster and seen[j] != stamp:
+                        seen[j] = stamp
+                        following.append(j)
+                        if parent is not None:
+                            parent[j] = i
+            level = following
+            depth += 1
+        return found, expanded
+
+    def _local_path(self, source, target):
+        parent = {}
+        found, expanded = self._local_bfs(source, (target,), parent)
+        path = deque([target])
+        i = target
+        while i != source:
+            i = parent[i]
+            path.appendleft(i)
+        return path, expanded
+
+    def solve(self, start=None, goal=None):
+        """Path between two cells through the abstract graph.
+
+        Returns a :class:`SearchResult` whose ``expanded`` counts the abstract
+        nodes and cluster cells touched by this query alone.
+        """
+        grid = self.grid
+        source, target = _endpoints(grid, start, goal)
+        result = SearchResult(generated=1, max_frontier=1)
+        cells = grid.cells
+        if cells[source] or cells[target]:
+            return result
+
+        # Temporary edges from the start and into the goal, plus a direct
+        # one when both are in the same cluster
+        start_cluster, goal_cluster = self.cluster_of[source], self.cluster_of[target]
+        targets = set(self.entrances.get(start_cluster, ()))
+        if start_cluster == goal_cluster:
+            targets.add(target)
+        start_edges, expanded = self._local_bfs(source, targets)
+        result.expanded += expanded
+        goal_edges, expanded = self._local_bfs(target, self.entrances.get(goal_cluster, ()))
+        result.expanded += expanded
+
+        route = self._abstract_route(source, target, start_edges, goal_edges, result)
+        if route is None:
+            return result
+
+        # Refine every abstract edge; steps between facing entrances are
+        # already single moves
+        width = grid.width
+        path = [source]
+        for a, b in zip(route, route[1:]):
+            if abs(a - b) in (1, width):
+                path.append(b)
+                continue
+            segment, expanded = self._local_path(a, b)
+            result.expanded += expanded
+            segment.popleft()
+            path.extend(segment)
+        result.path = [grid.coords(i) for i in path]
+        return result
+
+    def _abstract_route(self, source, target, start_edges, goal_edges, result):
+        width = self.grid.width
+        gx, gy = target % width, target // width
+        edges = self.edges
+        best_g = {source: 0}
+        parent = {source: None}
+        closed = set()
+        pq = [(abs(source % width - gx) + abs(source // width - gy), 0, source)]
+
+        while pq:
+            f, neg_g, i = heapq.heappop(pq)
+            if i in closed:
+                continue
+            closed.add(i)
+            result.expanded += 1
+
+            if i == target:
+                route = []
+                while i is not None:
+                    route.append(i)
+                    i = parent[i]
+                route.reverse()
+                return route
+
+            neighbours = edges.get(i, {})
+            if i == source or i in goal_edges:
+                neighbours = dict(neighbours)
+                if i == source:
+                    neighbours.update(start_edges)
+                if i in goal_edges:
+                    neighbours[target] = goal_edges[i]
+            for j, cost in neighbours.items():
+                new_g = cost - neg_g
+                if new_g < best_g.get(j, new_g + 1):
+                    best_g[j] = new_g
+                    parent[j] = i
+                    heapq.heappush(pq, (new_g + abs(j % width - gx) + abs(j // width - gy), -new_g, j))
+                    result.generated += 1
+            if len(pq) > result.max_frontier:
+                result.max_frontier = len(pq)
+        return None
+
+
+def _label_clusters(grid, size):
+    cluster_of = array('i', [-1]) * len(grid.cells)
+    per_row = -(-grid.cols // size)
+    columns = [x // size for x in range(grid.cols)]
+    for y in range(grid.rows):
+        first = (y // size) * per_row
+        start = grid.index(0, y)
+        row = grid.cells[start:start + grid.cols]
+        cluster_of[start:start + grid.cols] = array('i', [-1 if wall else first + c for c, wall in zip(columns, row)])
+    return cluster_of
+
+
+def _border_runs(grid, size):
+    # Pairs of facing open cells across every cluster border, grouped into
+    # runs that end at walls and at cluster corners
+    cells = grid.cells
+    for x in range(size, grid.cols, size):
+        for top in range(0, grid.rows, size):
+            run = []
+            for y in range(top, min(top + size, grid.rows)):
+                a = grid.index(x - 1, y)
+                if not cells[a] and not cells[a + 1]:
+                    run.append((a, a + 1))
+                elif run:
+                    yield run
+                    run = []
+            if run:
+                yield run
+    width = grid.width
+    for y in range(size, grid.rows, size):
+        for left in range(0, grid.cols, size):
+            run = []
+            for x in range(left, min(left + size, grid.cols)):
+                a = grid.index(x, y - 1)
+                if not cells[a] and not cells[a + width]:
+                    run.append((a, a + width))
+                elif run:
+                    yield run
+                    run = []
+            if run:
+                yield run
+
+
+def build_hierarchy(maze, cluster_size=16):
+    """Cluster the maze and precompute its abstract graph."""
+    grid = as_grid(maze)
+    hierarchy = Hierarchy(grid, cluster_size)
+    cluster_of = hierarchy.cluster_of
+    entrances = hierarchy.entrances
+
+    for run in _border_runs(grid, cluster_size):
+        pairs = (run[0], run[-1]) if len(run) >= WIDE_ENTRANCE else (run[len(run) // 2],)
+        for a, b in pairs:
+            hierarchy._add_edge(a, b, 1)
+            entrances.setdefault(cluster_of[a], set()).add(a)
+            entrances.setdefault(cluster_of[b], set()).add(b)
+
+    # Distances are symmetric, so each entrance only searches for the ones
+    # after it
+    for cluster, nodes in entrances.items():
+        nodes = sorted(nodes)
+        for k, a in enumerate(nodes[:-1]):
+            found, _ = hierarchy._local_bfs(a, nodes[k + 1:])
+            for b, cost in found.items():
+                hierarchy._add_edge(a, b, cost)
+    return hierarchy
+
+
+def hpa_solve(maze, start=None, goal=None, cluster_size=16):
+    """Build a :class:`Hierarchy` and answer one query with it.
+
+    For many queries on the same maze, keep the result of
+    :func:`build_hierarchy` and call its ``solve`` instead.
+    """
+    return build_hierarchy(maze, cluster_size).solve(start, goal)
@@ -0,0 +1,193 @@
+"""Incremental replanning with D* Lite while cells are toggled.
+
+:class:`DStarLite` keeps its search state between calls. After cells are
+turned into walls or opened up (or the start moves), the next
+:meth:`~DStarLite.solve` only re-expands the cells whose cost to the goal
+actually changed, instead of searching the whole maze again. With the start
+kept in place this is LPA*; moving it with :meth:`~DStarLite.move_start` is
+what D* Lite adds.
+
+The search runs backwards from the goal. ``g`` is the settled cost from a
+cell to the goal and ``rhs`` the one-step lookahead from its neighbours; a
+cell where the two differ is queued. Costs follow
+:func:`~maze_core.solvers.ucs_solve`: a step costs the weight of the cell it
+steps onto, so paths are optimal on weighted terrain too.
+"""
+
+import heapq
+
+from .grid import UNREACHED_COST, CellMask, as_grid
+from .solvers import DIRECTIONS, SearchResult, _endpoints, run_steps
+
+
+class DStarLite:
+    """Shortest-path planner that repairs its previous answer.
+
+    Works on the maze's :class:`~maze_core.grid.Grid` in place, so cells
+    toggled through the planner are changed in that grid too.
+    """
+
+    __slots__ = ('grid', 'start', 'goal', 'offsets', 'weights', 'g', 'rhs', 'km', 'queue', 'queued', 'last_start',
+                 'pushes')
+
+    def __init__(self, maze, start=None, goal=None, directions=DIRECTIONS):
+        grid = as_grid(maze)
+        self.grid = grid
+        self.start, self.goal = _endpoints(grid, start, goal)
+        self.last_start = self.start
+        self.offsets = grid.neighbor_offsets(directions)
+        self.weights = grid.weights if grid.weights is not None else bytes(b'\x01') * len(grid.cells)
+        self.g = grid.new_costs()
+        self.rhs = grid.new_costs()
+        # Added to every key after the start moves, instead of re-keying
+        # the whole queue
+        self.km = 0
+        # Heap of (k1, k2, cell) with stale entries left in place; ``queued``
+        # holds the live key of every queued cell
+        self.queue = []
+        self.queued = {}
+        self.pushes = 0
+        self.rhs[self.goal] = 0
+        self._push(self.goal)
+
+    def _heuristic(self, i):
+        width = self.grid.width
+        s = self.start
+        return abs(i % width - s % width) + abs(i // width - s // width)
+
+    def _key(self, i):
+        m = min(self.g[i], self.rhs[i])
+        return m + self._heuristic(i) + self.km, m
+
+    def _push(self, i):
+        key = self.queued[i] = self._key(i)
+        heapq.heappush(self.queue, (key[0], key[1], i))
+        self.pushes += 1
+
+    def _update(self, i):
+        cells, g = self.grid.cells, self.g
+        if i != self.goal:
+            best = UNREACHED_COST
+            if not cells[i]:
+                weights = self.weights
+                for offset in self.offsets:
+                    j = i + offset
+                    if not cells[j] and g[j] != UNREACHED_COST and weights[j] + g[j] < best:
+                        best = weights[j] + g[j]
+            self.rhs[i] = best
+        if g[i] != self.rhs[i]:
+            self._push(i)
+        else:
+            self.queued.pop(i, None)
+
+    def _update_around(self, i):
+        # Everything whose lookahead can go through ``i``, and ``i`` itself
+        self._update(i)
+        for offset in self.offsets:
+            self._update(i - offset)
+
+    def set_wall(self, cell, wall=True):
+        """Turn ``cell`` into a wall or open it; the next solve repairs."""
+        i = self.grid.index(*cell)
+        wall = 1 if wall else 0
+        if self.grid.cells[i] != wall:
+            self.grid.cells[i] = wall
+            self._update_around(i)
+
+    def toggle(self, cell):
+        """Flip ``cell`` between wall and open and return whether it is now a wall."""
+        wall = not self.grid.cells[self.grid.index(*cell)]
+        self.set_wall(cell, wall)
+        return wall
+
+    def move_start(self, cell):
+        """Plan from ``cell`` from now on, e.g. after the agent moved there."""
+        self.start = self.grid.index(*cell)
+        width = self.grid.width
+        self.km += abs(self.start % width - self.last_start % width) + abs(self.start // width - self.last_start // width)
+        self.last_start = self.start
+
+    def _top(self):
+        # Drop stale heap entries and return the live top, or None
+        queue, queued = self.queue, self.queued
+        while queue:
+            k1, k2, i = queue[0]
+            if queued.get(i) == (k1, k2):
+                return queue[0]
+            heapq.heappop(queue)
+        return None
+
+    def _path(self):
+        cells, g, weights, offsets = self.grid.cells, self.g, self.weights, self.offsets
+        i = self.start
+        if g[i] == UNREACHED_COST:
+            return None
+        path = [i]
+        while i != self.goal:
+            best = UNREACHED_COST
+            for offset in offsets:
+                j = i + offset
+                if not cells[j] and g[j] != UNREACHED_COST and weights[j] + g[j] < best:
+                    best, step = weights[j] + g[j], j
+            i = step
+            path.append(i)
+        return [self.grid.coords(i) for i in path]
+
+    def _repair(self, result, explored):
+        g, rhs, queued = self.g, self.rhs, self.queued
+        pushes = self.pushes
+        while True:
+            top = self._top()
+            if top is None:
+                break
+            k_old = top[:2]
+            start = self.start
+            if not (k_old < self._key(start) or rhs[start] != g[start]):
+                break
+            i = heapq.heappop(self.queue)[2]
+            k_new = self._key(i)
+            if k_old < k_new:
+                self._push(i)  # Key went stale after the start moved
+                continue
+            del queued[i]
+            result.expanded += 1
+            if explored is not None:
+                explored[i] = 1
+            yield i
+
+            if g[i] > rhs[i]:
+                g[i] = rhs[i]
+            else:
+                g[i] = UNREACHED_COST
+                self._update(i)
+            for offset in self.offsets:
+                self._update(i - offset)
+            if len(queued) > result.max_frontier:
+                result.max_frontier = len(queued)
+
+        result.generated = self.pushes - pushes
+        result.path = self._path()
+
+    def steps(self):
+        """Repair the plan one expansion at a time.
+
+        Yields ``(current, explored)`` like the ``*_steps`` solvers, where
+        ``explored`` only covers this repair, and returns the
+        :class:`SearchResult`. ``expanded`` counts the cells re-expanded by
+        this repair alone.
+        """
+        result = SearchResult()
+        explored = self.grid.new_mask()
+        view = CellMask(self.grid, explored)
+        for i in self._repair(result, explored):
+            yield self.grid.coords(i), view
+        return result
+
+    def solve(self, on_expand=None):
+        """Repair the plan and return the :class:`SearchResult`."""
+        if on_expand:
+            return run_steps(self.steps(), on_expand)
+        result = SearchResult()
+        for _ in self._repair(result, None):
+            pass
+        return result
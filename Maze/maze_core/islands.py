@@ -0,0 +1,185 @@
+"""Island-model genetic solver spread over worker processes.
+
+Each island is a separate process evolving its own population with the
+array-based engine from :mod:`maze_core.vectorized_genetic`. Every
+``migration_interval`` generations an island sends copies of its best
+individuals to the next island in a ring and takes in whatever its
+neighbour has sent, replacing some of its own children. Migration never
+waits, so a slow island does not hold the others up.
+
+The maze is placed in a :class:`multiprocessing.shared_memory.SharedMemory`
+block once. Workers attach to it by name and only receive its size, so the
+maze itself is never pickled. Workers report the best individual of each
+epoch back to the parent, which yields it like
+:func:`maze_core.genetic.genetic_steps`. The first island to reach the goal
+stops all the others.
+
+Needs NumPy, like :mod:`maze_core.vectorized_genetic`.
+"""
+
+import multiprocessing
+import os
+import queue
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .genetic import DIR_KEYS
+from .grid import Grid, as_grid
+from .solvers import SearchResult, run_steps
+from .vectorized_genetic import (
+    _best_path,
+    _move_offsets,
+    _next_generation,
+    _replay,
+    _state_distances,
+    _transition_table,
+)
+
+
+def _drain(q):
+    try:
+        while True:
+            q.get_nowait()
+    except (queue.Empty, OSError, ValueError):
+        pass
+
+
+def _island(island, shm_name, rows, cols, source, target, pop_size, path_len, generations,
+            migration_interval, migrants, mutation_rate, seed, inbox, outbox, reports, stop):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        # The transition table and distance field are all the evolution
+        # needs, so the shared maze is only read while building them. The
+        # field skips the cache, which would otherwise keep a view into the
+        # block
+        cells = shm.buf[:(rows + 2) * (cols + 2)]
+        grid = Grid(rows, cols, cells)
+        table = _transition_table(grid, target, _move_offsets(grid))
+        distances = _state_distances(grid, grid.coords(target), cache=False)
+        size = len(cells)
+        del grid
+        cells.release()
+    finally:
+        shm.close()
+
+    rng = np.random.default_rng(None if seed is None else [seed, island])
+    genes = rng.integers(0, len(DIR_KEYS), size=(pop_size, path_len), dtype=np.int8)
+    evaluated = 0
+
+    for generation in range(generations):
+        if stop.is_set():
+            break
+        closest, reached = _replay(table, size, genes, source, target, distances)
+        scores = -closest
+        evaluated += 1
+
+        solved = bool(reached.any())
+        epoch_end = (generation + 1) % migration_interval == 0 or generation == generations - 1
+        if solved or epoch_end:
+            best = int(np.argmax(reached)) if solved else int(np.argmax(scores))
+            reports.put((island, generation, evaluated, int(scores[best]), genes[best].tobytes(), solved))
+            evaluated = 0
+            if solved:
+                break
+
+        if epoch_end and migrants:
+            outbox.put(genes[np.argpartition(scores, -migrants)[-migrants:]])
+
+        genes = _next_generation(genes, scores, rng, mutation_rate)
+
+        # Children come out in random order, so overwriting the first rows
+        # replaces random children with the immigrants
+        row = 0
+        while row < pop_size:
+            try:
+                immigrants = inbox.get_nowait()
+            except queue.Empty:
+                break
+            immigrants = immigrants[:pop_size - row]
+            genes[row:row + len(immigrants)] = immigrants
+            row += len(immigrants)
+
+    reports.put((island, None, evaluated, None, None, False))
+
+
+def island_genetic_steps(maze, islands=None, pop_size=100, generations=100, path_len=None,
+                         start=(0, 0), goal=None, migration_interval=10, migrants=5,
+                         mutation_rate=0.1, seed=None):
+    """Evolve ``islands`` populations of ``pop_size`` in parallel.
+
+    ``islands`` defaults to the number of CPUs. Yields
+    ``(generation, best_score, path_coords)`` each time an island finishes an
+    epoch of ``migration_interval`` generations or reaches the goal, and
+    returns the :class:`SearchResult`.
+    """
+    grid = as_grid(maze)
+    if goal is None:
+        goal = (grid.cols - 1, grid.rows - 1)
+    if path_len is None:
+        path_len = 2 * (grid.rows + grid.cols)
+    if islands is None:
+        islands = os.cpu_count() or 1
+    migrants = min(migrants, pop_size)
+    source, target = grid.index(*start), grid.index(*goal)
+    offsets = _move_offsets(grid)
+    result = SearchResult()
+
+    ctx = multiprocessing.get_context('spawn')
+    shm = shared_memory.SharedMemory(create=True, size=len(grid.cells))
+    workers = []
+    try:
+        shm.buf[:len(grid.cells)] = grid.cells
+        inboxes = [ctx.Queue() for _ in range(islands)]
+        reports = ctx.Queue()
+        stop = ctx.Event()
+        for island in range(islands):
+            args = (island, shm.name, grid.rows, grid.cols, source, target, pop_size, path_len, generations,
+                    migration_interval, migrants, mutation_rate, seed,
+                    inboxes[island], inboxes[(island + 1) % islands], reports, stop)
+            workers.append(ctx.Process(target=_island, args=args, daemon=True))
+        for worker in workers:
+            worker.start()
+
+        running = islands
+        while running:
+            try:
+                island, generation, evaluated, score, moves, solved = reports.get(timeout=1)
+            except queue.Empty:
+                if not any(worker.is_alive() for worker in workers):
+                    break  # A worker died without reporting
+                continue
+            result.expanded += evaluated * pop_size * path_len
+            result.generated += evaluated * pop_size
+            if generation is None:
+                running -= 1
+                continue
+
+            path_coords = _best_path(grid, np.frombuffer(moves, dtype=np.int8), source, target, offsets)
+            yield generation, score, path_coords
+            if solved:
+                result.path = path_coords
+                break
+
+        return result
+    finally:
+        if workers:
+            stop.set()
+            # Workers cannot exit while their queued messages are unread
+            for worker in workers:
+                while worker.is_alive():
+                    _drain(reports)
+                    for inbox in inboxes:
+                        _drain(inbox)
+                    worker.join(0.05)
+        shm.close()
+        shm.unlink()
+
+
+def island_genetic_solve(maze, islands=None, pop_size=100, generations=100, path_len=None,
+                         start=(0, 0), goal=None, migration_interval=10, migrants=5,
+                         mutation_rate=0.1, seed=None, on_generation=None):
+    """Run :func:`island_genetic_steps` to the end."""
+    steps = island_genetic_steps(maze, islands, pop_size, generations, path_len, start, goal,
+                                 migration_interval, migrants, mutation_rate, seed)
+    return run_steps(steps, on_generation)
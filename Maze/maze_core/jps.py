@@ -0,0 +1,123 @@
+"""Jump Point Search for 4-connected, uniform-cost grids.
+
+JPS runs A* over "jump points" only. From each expanded node it scans in a
+straight line and stops only where the search could branch in a way that no
+shorter path through the parent could: at the goal, or next to an obstacle
+corner (a forced neighbour). In 4-connected grids a vertical scan also
+starts a horizontal scan at every cell, and stops if either finds something.
+Long runs of open cells are skipped without being pushed onto the heap, so
+on open, low-obstacle mazes far fewer nodes are expanded than with A*, and
+the path is still optimal.
+"""
+
+import heapq
+
+from .grid import UNREACHED_COST
+from .solvers import DIRECTIONS, _solve, _steps
+
+
+def _jump_horizontal(cells, i, dx, width, target):
+    while True:
+        i += dx
+        if cells[i]:
+            return -1
+        if i == target:
+            return i
+        # Forced neighbour: a cell above/below is open here but was walled
+        # off above/below the cell we came from
+        if (not cells[i - width] and cells[i - width - dx]) or (not cells[i + width] and cells[i + width - dx]):
+            return i
+
+
+def _jump_vertical(cells, i, dy, width, target):
+    while True:
+        i += dy
+        if cells[i]:
+            return -1
+        if i == target:
+            return i
+        if (not cells[i - 1] and cells[i - 1 - dy]) or (not cells[i + 1] and cells[i + 1 - dy]):
+            return i
+        # Vertical moves must also look for horizontal jump points
+        if _jump_horizontal(cells, i, 1, width, target) >= 0 or _jump_horizontal(cells, i, -1, width, target) >= 0:
+            return i
+
+
+def _fill_path(grid, parent, target):
+    # Parents link jump points; fill in the straight runs between them
+    width = grid.width
+    cells = [target]
+    i = target
+    while parent[i] != -1:
+        p = parent[i]
+        step = 1 if abs(i - p) < width else width
+        if p < i:
+            step = -step
+        while i != p:
+            i += step
+            cells.append(i)
+    cells.reverse()
+    return [grid.coords(i) for i in cells]
+
+
+def _jps(grid, source, target, directions, result, explored):
+    width = grid.width
+    cells = grid.cells
+    gx, gy = target % width, target // width
+    start_offsets = grid.neighbor_offsets(directions)
+    closed = grid.new_mask()
+    parent = grid.new_parents()
+    best_g = grid.new_costs()
+    best_g[source] = 0
+    pq = [(abs(source % width - gx) + abs(source // width - gy), 0, source)]
+
+    while pq:
+        f, neg_g, i = heapq.heappop(pq)
+
+        if closed[i]:
+            continue
+        closed[i] = 1
+        result.expanded += 1
+        if explored is not None:
+            explored[i] = 1
+        yield i
+
+        if i == target:
+            result.path = _fill_path(grid, parent, target)
+            return
+
+        # Prune to the natural and forced directions for the way we came in
+        p = parent[i]
+        if p == -1:
+            offsets = start_offsets
+        elif abs(i - p) < width:
+            offsets = (-width, width, 1 if i > p else -1)
+        else:
+            offsets = (-1, 1, width if i > p else -width)
+
+        g = -neg_g
+        for offset in offsets:
+            if abs(offset) == 1:
+                j = _jump_horizontal(cells, i, offset, width, target)
+            else:
+                j = _jump_vertical(cells, i, offset, width, target)
+            if j < 0:
+                continue
+            new_g = g + (abs(j - i) if abs(offset) == 1 else abs(j - i) // width)
+            if new_g < best_g[j]:
+                if best_g[j] != UNREACHED_COST:
+                    result.duplicates += 1
+                best_g[j] = new_g
+                parent[j] = i
+                heapq.heappush(pq, (new_g + abs(j % width - gx) + abs(j // width - gy), -new_g, j))
+                result.generated += 1
+        if len(pq) > result.max_frontier:
+            result.max_frontier = len(pq)
+
+
+def jps_steps(maze, start=None, goal=None, directions=DIRECTIONS):
+    return _steps(_jps, maze, start, goal, directions)
+
+
+def jps_solve(maze, start=None, goal=None, directions=DIRECTIONS, on_expand=None):
+    return _solve(_jps, maze, start, goal, directions, on_expand)
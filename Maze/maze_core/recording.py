@@ -0,0 +1,168 @@
+"""Compact binary recordings of a search's exploration order.
+
+:func:`record` drives a ``*_steps`` generator at full speed and keeps every
+event it sees in a :class:`Recording`: each expansion, each cell entering
+the frontier, and the cells of the solution path. The recording is saved to
+a small file and played back later by :mod:`maze_core.replay`, at any speed
+and from any step, so an expensive search only has to run once and never
+waits on the screen.
+
+Push events are derived from the expansion order, so that recording adds
+nothing to the searches themselves: a cell is pushed when it is first seen
+next to an expanded cell. That is exactly when the searches here first queue
+it, with three exceptions. Later re-pushes of a cell are not recorded. A
+cell reached by both halves of a bidirectional search is pushed once.
+Depth-bounded searches (DLS, IDS, IDA*) are shown pushing past their bound.
+Jump point search queues distant jump points instead, so record it with
+``pushes=False``.
+
+File layout (little-endian)::
+
+    header   magic, version, rows, cols, start, goal, walls size
+    walls    zlib-compressed row-major bytes, 1 for a wall
+    events   one varint per event until the end of the file
+
+Cells are row-major indices ``y * cols + x``. Each event stores the
+zigzag-encoded difference from the previous event's cell shifted left by
+two, with the event type in the low two bits. Consecutive events are
+nearly always close together, so most take a single byte.
+"""
+
+import struct
+import zlib
+from array import array
+
+from .grid import as_grid
+from .solvers import DIRECTIONS, _endpoints
+
+# Event types
+EXPAND = 0
+PUSH = 1
+SOLUTION = 2
+
+MAGIC = b'MZRC'
+VERSION = 1
+_HEADER = struct.Struct('<4sBHHIII')
+
+
+class Recording:
+    """Events of one search, with the maze they ran on.
+
+    ``cells`` and ``kinds`` hold the events in order; ``walls`` is one byte
+    per cell, row-major.
+    """
+
+    __slots__ = ('rows', 'cols', 'walls', 'start', 'goal', 'cells', 'kinds')
+
+    def __init__(self, rows, cols, walls, start, goal):
+        self.rows = rows
+        self.cols = cols
+        self.walls = walls
+        self.start = start
+        self.goal = goal
+        self.cells = array('i')
+        self.kinds = bytearray()
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def append(self, kind, cell):
+        self.cells.append(cell)
+        self.kinds.append(kind)
+
+    def to_bytes(self):
+        walls = zlib.compress(bytes(self.walls))
+        out = bytearray(_HEADER.pack(MAGIC, VERSION, self.rows, self.cols, self.start, self.goal, len(walls)))
+        out += walls
+        append = out.append
+        last = 0
+        for cell, kind in zip(self.cells, self.kinds):
+            delta = cell - last
+            last = cell
+            value = ((delta << 1 if delta >= 0 else (-delta << 1) - 1) << 2) | kind
+            while value > 0x7f:
+                append(value & 0x7f | 0x80)
+                value >>= 7
+            append(value)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, rows, cols, start, goal, size = _HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not a maze recording (or from an unsupported version)")
+        offset = _HEADER.size
+        recording = cls(rows, cols, bytearray(zlib.decompress(data[offset:offset + size])), start, goal)
+        cells, kinds = recording.cells, recording.kinds
+        last = value = shift = 0
+        for byte in memoryview(data)[offset + size:]:
+            value |= (byte & 0x7f) << shift
+            if byte & 0x80:
+                shift += 7
+                continue
+            zigzag = value >> 2
+            last += zigzag >> 1 if not zigzag & 1 else -((zigzag + 1) >> 1)
+            cells.append(last)
+            kinds.append(value & 3)
+            value = shift = 0
+        if shift:
+            raise ValueError("recording ends in the middle of an event")
+        return recording
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+
+def record(steps, maze, start=None, goal=None, directions=DIRECTIONS, pushes=True):
+    """Run ``steps`` to the end and return ``(result, recording)``.
+
+    ``steps`` is a ``*_steps`` generator over ``maze`` with the same start,
+    goal and directions. With ``pushes`` false only expansions and the
+    solution are kept.
+    """
+    grid = as_grid(maze)
+    source, target = _endpoints(grid, start, goal)
+    rows, cols, width = grid.rows, grid.cols, grid.width
+    walls = bytearray()
+    for y in range(rows):
+        row = grid.index(0, y)
+        walls += grid.cells[row:row + cols]
+    recording = Recording(rows, cols, walls, (source // width - 1) * cols + source % width - 1,
+                          (target // width - 1) * cols + target % width - 1)
+    cells, kinds = recording.cells, recording.kinds
+    offsets = grid.neighbor_offsets(directions)
+    # Walls start out "seen", so they are never pushed
+    seen = bytearray(grid.cells)
+    seen[source] = 1
+
+    # A cell's neighbours are pushed once the search carries on past it; the
+    # searches stop at the goal without pushing anything
+    i = None
+    while True:
+        try:
+            (x, y), _ = next(steps)
+        except StopIteration as stop:
+            result = stop.value
+            break
+        if pushes and i is not None:
+            for offset in offsets:
+                j = i + offset
+                if not seen[j]:
+                    seen[j] = 1
+                    cells.append((j // width - 1) * cols + j % width - 1)
+                    kinds.append(PUSH)
+        cells.append(y * cols + x)
+        kinds.append(EXPAND)
+        i = (y + 1) * width + x + 1
+
+    # The deepening searches return their final limit next to the result
+    found = result[0] if isinstance(result, tuple) else result
+    for x, y in found.path or ():
+        recording.append(SOLUTION, y * cols + x)
+    return result, recording
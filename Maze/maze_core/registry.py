@@ -0,0 +1,96 @@
+"""Every pure-Python maze solver under one short name.
+
+``SOLVERS`` maps a name to a function that takes a
+:class:`~maze_core.grid.Grid` and returns a
+:class:`~maze_core.solvers.SearchResult`. ``STEPS`` maps the same names (bar
+``hpa``, which has no step form) to the matching ``*_steps`` generator, for
+front-ends that animate the search. Depth-limited searches that also return
+their final limit are unwrapped so that every entry returns a plain
+:class:`~maze_core.solvers.SearchResult`.
+
+Solvers listed in ``EVOLVING`` yield ``(generation, best_score, path_coords)``
+instead of ``(current, explored)``. Those listed in ``SEEDED`` are random and
+also take a ``seed`` keyword; :func:`seed_options` builds the keywords for
+any name.
+"""
+
+from .genetic import genetic_solve, genetic_steps
+from .hpa import hpa_solve
+from .jps import jps_solve, jps_steps
+from .solvers import (
+    a_star_solve,
+    a_star_steps,
+    bfs_solve,
+    bfs_steps,
+    bidirectional_a_star_solve,
+    bidirectional_a_star_steps,
+    bidirectional_bfs_solve,
+    bidirectional_bfs_steps,
+    dfs_solve,
+    dfs_steps,
+    dls_solve,
+    dls_steps,
+    greedy_solve,
+    greedy_steps,
+    ida_star_solve,
+    ida_star_steps,
+    ids_solve,
+    ids_steps,
+    ucs_solve,
+    ucs_steps,
+)
+
+
+def _dls_limit(grid):
+    return (grid.rows + grid.cols) * 2
+
+
+def _ids_limit(grid):
+    return grid.rows + grid.cols + 10
+
+
+def _result_only(steps):
+    # Drop the depth limit returned next to the result
+    result, _ = yield from steps
+    return result
+
+
+# Depth limits follow the GUI scripts
+SOLVERS = {
+    'bfs': bfs_solve,
+    'bibfs': bidirectional_bfs_solve,
+    'dfs': dfs_solve,
+    'ucs': ucs_solve,
+    'dls': lambda grid: dls_solve(grid, _dls_limit(grid)),
+    'ids': lambda grid: ids_solve(grid, _ids_limit(grid))[0],
+    'idastar': lambda grid: ida_star_solve(grid)[0],
+    'greedy': greedy_solve,
+    'astar': a_star_solve,
+    'biastar': bidirectional_a_star_solve,
+    'jps': jps_solve,
+    'hpa': hpa_solve,  # Includes building the hierarchy
+    'genetic': genetic_solve,
+}
+
+STEPS = {
+    'bfs': bfs_steps,
+    'bibfs': bidirectional_bfs_steps,
+    'dfs': dfs_steps,
+    'ucs': ucs_steps,
+    'dls': lambda grid: dls_steps(grid, _dls_limit(grid)),
+    'ids': lambda grid: _result_only(ids_steps(grid, _ids_limit(grid))),
+    'idastar': lambda grid: _result_only(ida_star_steps(grid)),
+    'greedy': greedy_steps,
+    'astar': a_star_steps,
+    'biastar': bidirectional_a_star_steps,
+    'jps': jps_steps,
+    'genetic': genetic_steps,
+}
+
+EVOLVING = {'genetic'}
+SEEDED = {'genetic'}
+
+
+def seed_options(name, seed):
+    """Keywords that pass ``seed`` to solver ``name``, if it takes one."""
+    return {'seed': seed} if name in SEEDED else {}
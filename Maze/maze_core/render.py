@@ -0,0 +1,64 @@
+"""Incremental pygame renderer for the maze front-ends.
+
+Front-ends paint cells through :class:`MazeRenderer`, which remembers the color
+last drawn in every cell and only redraws a cell when its color changes. The
+rectangles touched since the last :meth:`~MazeRenderer.flush` are pushed with
+``pygame.display.update(rects)``, so a frame costs time proportional to the
+number of cells that changed instead of the grid area.
+
+This is the only ``maze_core`` module that imports pygame.
+"""
+
+import pygame
+
+
+class MazeRenderer:
+    def __init__(self, screen, rows, cols, cell_size, grid_color=None, inset=0):
+        self.screen = screen
+        self.rows = rows
+        self.cols = cols
+        self.cell_size = cell_size
+        self.grid_color = grid_color  # 1px outline drawn around every cell
+        self.inset = inset            # Pixels left undrawn on the right/bottom
+        self.colors = [None] * (rows * cols)
+        self.dirty = []
+
+    def paint(self, x, y, color):
+        i = y * self.cols + x
+        if self.colors[i] == color:
+            return
+        self.colors[i] = color
+        size = self.cell_size
+        rect = pygame.Rect(x * size, y * size, size, size)
+        pygame.draw.rect(self.screen, color, (rect.x, rect.y, size - self.inset, size - self.inset))
+        if self.grid_color is not None:
+            pygame.draw.rect(self.screen, self.grid_color, rect, 1)
+        self.dirty.append(rect)
+
+    def invalidate(self, cells=None):
+        """Forget what is on screen so the next paint redraws these cells.
+
+        With no ``cells`` the whole grid is forgotten, e.g. after the screen
+        was cleared.
+        """
+        if cells is None:
+            self.colors = [None] * (self.rows * self.cols)
+            return
+        for x, y in cells:
+            self.colors[y * self.cols + x] = None
+
+    def cells_in(self, rect):
+        """Cells overlapping a screen rectangle, e.g. under a text overlay."""
+        rect = pygame.Rect(rect)
+        size = self.cell_size
+        x0, y0 = max(rect.left // size, 0), max(rect.top // size, 0)
+        x1 = min((rect.right - 1) // size, self.cols - 1)
+        y1 = min((rect.bottom - 1) // size, self.rows - 1)
+        return [(x, y) for y in range(y0, y1 + 1) for x in range(x0, x1 + 1)]
+
+    def flush(self, extra_rects=()):
+        """Push every rectangle painted since the last flush to the display."""
+        rects = self.dirty + list(extra_rects)
+        if rects:
+            pygame.display.update(rects)
+        self.dirty = []
@@ -0,0 +1,238 @@
+"""Play back a search recording, or export it as image frames.
+
+Record a search once at full speed, then watch it as often as needed. Run
+from the ``Maze/`` directory::
+
+    python -m maze_core --algo astar --size 512 --record astar.mzr
+    python -m maze_core.replay astar.mzr --speed 64
+    python -m maze_core.replay astar.mzr --export frames --every 100
+
+A step is one expansion together with the pushes that followed it. While
+playing:
+
+* ``space`` pauses and resumes.
+* ``+``/``=`` and ``-`` double and halve the speed. Below one step per frame,
+  a step is shown every few frames.
+* ``Left``/``Right`` seek back and forward by a second of playback and
+  pause. ``Home``/``End`` jump to the first and last step.
+
+Seeking either way costs time proportional to the number of events skipped,
+not to the size of the recording.
+"""
+
+import argparse
+import os
+import sys
+from array import array
+from bisect import bisect_right
+
+import pygame
+
+from .recording import EXPAND, Recording
+from .render import MazeRenderer
+from .scheduler import FASTER_KEYS, SLOWER_KEYS
+
+WINDOW = 800  # Largest side of the window in pixels
+MIN_SPEED, MAX_SPEED = 1 / 16, 2 ** 20  # Steps per frame
+
+# Colors
+OPEN = (235, 235, 235)
+WALL = (40, 40, 40)
+FRONTIER = (200, 225, 200)
+EXPLORED = (150, 190, 230)
+CURRENT = (255, 200, 0)
+SOLUTION = (230, 60, 60)
+START = (40, 170, 60)
+GOAL = (240, 130, 0)
+
+# Color of an open cell by its last event type plus one; 0 means no event yet
+STATE_COLORS = (OPEN, EXPLORED, FRONTIER, SOLUTION)
+
+
+class Replay:
+    """Cell states of a recording at any position, reached by seeking.
+
+    ``position`` counts the events applied so far. Every event remembers the
+    state its cell had before it, so seeking back undoes events one by one
+    just as seeking forward applies them.
+    """
+
+    __slots__ = ('recording', 'state', 'previous', 'expand_at', 'position')
+
+    def __init__(self, recording):
+        self.recording = recording
+        self.state = bytearray(recording.rows * recording.cols)
+        self.previous = bytearray(len(recording))
+        # Event index of every expansion, i.e. where each step starts
+        self.expand_at = array('i')
+        state, previous = self.state, self.previous
+        for e, (cell, kind) in enumerate(zip(recording.cells, recording.kinds)):
+            previous[e] = state[cell]
+            state[cell] = kind + 1
+            if kind == EXPAND:
+                self.expand_at.append(e)
+        self.state[:] = bytes(len(state))
+        self.position = 0
+
+    @property
+    def steps(self):
+        return len(self.expand_at)
+
+    @property
+    def step(self):
+        """Steps shown at the current position."""
+        return bisect_right(self.expand_at, self.position - 1)
+
+    def position_of(self, step):
+        # Everything up to the next expansion; the last step also shows
+        # the solution
+        step = min(max(step, 0), self.steps)
+        return self.expand_at[step] if step < self.steps else len(self.recording)
+
+    def seek(self, step):
+        """Move to ``step`` and return the cells whose state changed."""
+        target = self.position_of(step)
+        cells, state = self.recording.cells, self.state
+        if target >= self.position:
+            kinds = self.recording.kinds
+            for e in range(self.position, target):
+                state[cells[e]] = kinds[e] + 1
+            changed = cells[self.position:target]
+        else:
+            previous = self.previous
+            for e in range(self.position - 1, target - 1, -1):
+                state[cells[e]] = previous[e]
+            changed = cells[target:self.position]
+        self.position = target
+        return changed
+
+    def current(self):
+        """Cell expanded by the latest step shown, or None."""
+        step = self.step
+        if step == 0 or self.position == len(self.recording):
+            return None
+        return self.recording.cells[self.expand_at[step - 1]]
+
+    def color(self, cell):
+        recording = self.recording
+        if cell == recording.start:
+            return START
+        if cell == recording.goal:
+            return GOAL
+        if recording.walls[cell]:
+            return WALL
+        return STATE_COLORS[self.state[cell]]
+
+
+def _paint(renderer, replay, cells, current=None):
+    cols = replay.recording.cols
+    for cell in cells:
+        renderer.paint(cell % cols, cell // cols, CURRENT if cell == current else replay.color(cell))
+
+
+def export_frames(recording, directory, every=1, cell_size=None):
+    """Save a PNG of every ``every``-th step (and the last) into ``directory``.
+
+    Needs no window. Returns the number of frames written.
+    """
+    rows, cols = recording.rows, recording.cols
+    if cell_size is None:
+        cell_size = max(WINDOW // max(rows, cols), 1)
+    os.makedirs(directory, exist_ok=True)
+    surface = pygame.Surface((cols * cell_size, rows * cell_size))
+    renderer = MazeRenderer(surface, rows, cols, cell_size)
+    replay = Replay(recording)
+    _paint(renderer, replay, range(rows * cols))
+    steps = list(range(0, replay.steps, every)) + [replay.steps]
+    for frame, step in enumerate(steps):
+        _paint(renderer, replay, replay.seek(step))
+        renderer.dirty = []  # Nothing is on screen to update
+        pygame.image.save(surface, os.path.join(directory, f"frame_{frame:06d}.png"))
+    return len(steps)
+
+
+def play(recording, fps=30, speed=1, step=0):
+    """Show ``recording`` in a window from ``step`` until it is closed."""
+    rows, cols = recording.rows, recording.cols
+    cell_size = max(WINDOW // max(rows, cols), 1)
+    pygame.init()
+    screen = pygame.display.set_mode((cols * cell_size, rows * cell_size))
+    renderer = MazeRenderer(screen, rows, cols, cell_size)
+    clock = pygame.time.Clock()
+    replay = Replay(recording)
+    replay.seek(step)
+    _paint(renderer, replay, range(rows * cols), replay.current())
+    renderer.flush()
+    paused = False
+    carry = 0.0  # Fraction of a step owed from slow frames
+    shown = None
+
+    while True:
+        target = replay.step
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                return
+            if event.type != pygame.KEYDOWN:
+                continue
+            if event.key == pygame.K_SPACE:
+                paused = not paused
+            elif event.key in FASTER_KEYS:
+                speed = min(speed * 2, MAX_SPEED)
+            elif event.key in SLOWER_KEYS:
+                speed = max(speed / 2, MIN_SPEED)
+            elif event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+                jump = max(int(speed * fps), 1)
+                target += jump if event.key == pygame.K_RIGHT else -jump
+                paused = True
+            elif event.key == pygame.K_HOME:
+                target = 0
+            elif event.key == pygame.K_END:
+                target = replay.steps
+
+        if not paused and target < replay.steps:
+            carry += speed
+            target += int(carry)
+            carry -= int(carry)
+        if replay.position != replay.position_of(target):
+            previous = replay.current()
+            changed = replay.seek(target)
+            current = replay.current()
+            _paint(renderer, replay, changed, current)
+            if previous is not None and previous != current:
+                _paint(renderer, replay, (previous,))
+            if current is not None:
+                _paint(renderer, replay, (current,), current)
+            renderer.flush()
+
+        caption = (replay.step, replay.steps, speed, paused)
+        if caption != shown:
+            state = "paused" if paused else f"{speed:g} steps/frame"
+            pygame.display.set_caption(f"Replay - step {replay.step}/{replay.steps}, {state}")
+            shown = caption
+        clock.tick(fps)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m maze_core.replay', description=__doc__.splitlines()[0])
+    parser.add_argument('recording', help="file written by python -m maze_core --record")
+    parser.add_argument('--speed', type=float, default=1, help="steps per frame, fractions allowed")
+    parser.add_argument('--fps', type=int, default=30, help="frames per second")
+    parser.add_argument('--step', type=int, default=0, help="step to start from")
+    parser.add_argument('--export', metavar='DIR', help="save PNG frames into DIR instead of playing")
+    parser.add_argument('--every', type=int, default=1, help="steps between exported frames")
+    args = parser.parse_args(argv)
+    if args.every < 1:
+        parser.error("--every must be at least 1")
+
+    recording = Recording.load(args.recording)
+    if args.export:
+        count = export_frames(recording, args.export, args.every)
+        print(f"Wrote {count} frames to {args.export}")
+    else:
+        play(recording, args.fps, min(max(args.speed, MIN_SPEED), MAX_SPEED), args.step)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""Frame-budgeted stepping of solver generators from a pygame loop.
+
+The ``*_steps`` generators in :mod:`maze_core.solvers` advance a search one
+expansion at a time. :class:`StepScheduler` runs as many of those steps per
+frame as the current speed and the frame's time budget allow, then flushes
+the frame, pumps the event queue and waits for the next tick, so the window
+stays responsive however long the search takes.
+
+While a search runs, ``+``/``=`` doubles the speed and ``-`` halves it, from one
+step per frame up to unthrottled (as many steps as fit in the budget).
+"""
+
+import time
+
+import pygame
+
+# Steps per frame the speed keys cycle through; None means unthrottled
+SPEEDS = [1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, None]
+
+FASTER_KEYS = (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS)
+SLOWER_KEYS = (pygame.K_MINUS, pygame.K_KP_MINUS)
+
+
+class StepScheduler:
+    def __init__(self, fps=60, budget=0.75, speed=1):
+        self.fps = fps
+        # Share of each frame spent stepping; the rest is left for drawing
+        self.budget = budget / fps
+        self.speed_index = SPEEDS.index(speed)
+        self.clock = pygame.time.Clock()
+
+    @property
+    def steps_per_frame(self):
+        return SPEEDS[self.speed_index]
+
+    def faster(self):
+        self.speed_index = min(self.speed_index + 1, len(SPEEDS) - 1)
+
+    def slower(self):
+        self.speed_index = max(self.speed_index - 1, 0)
+
+    def handle_event(self, event):
+        if event.type == pygame.QUIT:
+            pygame.quit()
+            raise SystemExit
+        if event.type == pygame.KEYDOWN:
+            if event.key in FASTER_KEYS:
+                self.faster()
+            elif event.key in SLOWER_KEYS:
+                self.slower()
+
+    def run(self, steps, on_step=None, on_frame=None, trace=None):
+        """Advance ``steps`` frame by frame until it finishes; return its result.
+
+        ``on_step`` receives each yielded item unpacked, and ``on_frame`` is
+        called once at the end of every frame, e.g. to flush the renderer.
+        With a :class:`~maze_core.trace.SearchTrace`, time spent stepping and
+        in the two callbacks is recorded as search and rendering.
+        """
+        if trace is not None:
+            steps, on_step, on_frame = trace.steps(steps), trace.timed(on_step), trace.timed(on_frame)
+        while True:
+            limit = self.steps_per_frame
+            deadline = time.perf_counter() + self.budget
+            count = 0
+            try:
+                while limit is None or count < limit:
+                    item = next(steps)
+                    if on_step:
+                        on_step(*item)
+                    count += 1
+                    if time.perf_counter() >= deadline:
+                        break
+            except StopIteration as stop:
+                if on_frame:
+                    on_frame()
+                return stop.value
+
+            if on_frame:
+                on_frame()
+            for event in pygame.event.get():
+                self.handle_event(event)
+            self.clock.tick(self.fps)
@@ -0,0 +1,750 @@
+"""Pure search routines for grid mazes.
+
+A maze is either a list of rows where ``maze[y][x] == 0`` is open and ``1`` is a
+wall, or a prebuilt :class:`~maze_core.grid.Grid`. Cells are ``(x, y)`` tuples
+at the API boundary; internally the solvers work on flat grid indices with
+bytearray visited/closed sets and parent-pointer arrays.
+
+None of the functions here touch pygame. Every algorithm comes in two forms:
+
+* ``*_solve`` runs the search to completion and returns a :class:`SearchResult`.
+  An optional ``on_expand(current, explored)`` callback is called once per
+  expanded node with a view of the cells expanded so far.
+* ``*_steps`` returns a generator that yields ``(current, explored)`` after each
+  expansion and returns the :class:`SearchResult` when it finishes, so a front
+  end can advance the search a few steps at a time from its own event loop
+  (see :func:`run_steps` and :mod:`maze_core.scheduler`).
+"""
+
+import heapq
+from collections import deque
+from dataclasses import dataclass
+
+from .grid import UNREACHED_COST, CellMask, as_grid
+
+# Directions (Right, Down, Left, Up)
+DIRECTIONS = [(1, 0), (0, 1), (-1, 0), (0, -1)]
+
+
+@dataclass
+class SearchResult:
+    path: list = None       # List of (x, y) cells from start to goal, or None
+    expanded: int = 0       # Nodes popped from the frontier and expanded
+    generated: int = 0      # Nodes pushed onto the frontier
+    max_frontier: int = 0   # Peak frontier size
+    duplicates: int = 0     # Pushes of a cell that had already been pushed
+    peak_visited: int = None  # Most distinct cells held as visited at once, if the solver knows
+
+
+def _endpoints(grid, start, goal):
+    if start is None:
+        start = (0, 0)
+    if goal is None:
+        goal = (grid.cols - 1, grid.rows - 1)
+    return grid.index(*start), grid.index(*goal)
+
+
+def heuristic(a, b):
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+
+def run_steps(steps, on_step=None):
+    """Drive a ``*_steps`` generator to the end and return its result."""
+    while True:
+        try:
+            item = next(steps)
+        except StopIteration as stop:
+            return stop.value
+        if on_step:
+            on_step(*item)
+
+
+def _finish(result):
+    # Searches that never forget a pushed cell end up holding every distinct
+    # one; IDA*, which starts over each iteration, sets its own peak
+    if result.peak_visited is None:
+        result.peak_visited = result.generated - result.duplicates
+    return result
+
+
+def _cell_steps(grid, search, explored, result):
+    # Turn the flat indices yielded by a core search into (x, y) cells
+    view = CellMask(grid, explored)
+    for i in search:
+        yield grid.coords(i), view
+    return _finish(result)
+
+
+def _steps(search, maze, start, goal, directions, *args):
+    grid = as_grid(maze)
+    source, target = _endpoints(grid, start, goal)
+    result = SearchResult(generated=1, max_frontier=1)
+    explored = grid.new_mask()
+    core = search(grid, source, target, directions, result, explored, *args)
+    return _cell_steps(grid, core, explored, result)
+
+
+def _solve(search, maze, start, goal, directions, on_expand, *args):
+    if on_expand:
+        return run_steps(_steps(search, maze, start, goal, directions, *args), on_expand)
+    grid = as_grid(maze)
+    source, target = _endpoints(grid, start, goal)
+    result = SearchResult(generated=1, max_frontier=1)
+    # Without a callback nobody looks at the explored set, so skip it
+    for _ in search(grid, source, target, directions, result, None, *args):
+        pass
+    return _finish(result)
+
+
+# Each core search below is a generator that yields the flat index of every
+# node it expands, marks it in ``explored`` unless that is None, and fills in
+# ``result`` as it goes.
+
+
+def _bfs(grid, source, target, directions, result, explored):
+    offsets = grid.neighbor_offsets(directions)
+    # Walls start out "visited", so one lookup covers both checks
+    visited = bytearray(grid.cells)
+    visited[source] = 1
+    parent = grid.new_parents()
+    queue = deque([source])
+
+    while queue:
+        i = queue.popleft()
+        result.expanded += 1
+        if explored is not None:
+            explored[i] = 1
+        yield i
+
+        if i == target:
+            result.path = grid.path(parent, target)
+            return
+
+        for offset in offsets:
+            j = i + offset
+            if not visited[j]:
+                visited[j] = 1
+                parent[j] = i
+                queue.append(j)
+                result.generated += 1
+        if len(queue) > result.max_frontier:
+            result.max_frontier = len(queue)
+
+
+def _dfs(grid, source, target, directions, result, explored):
+    # Reverse directions so the first direction is explored first
+    offsets = grid.neighbor_offsets(reversed(directions))
+    visited = bytearray(grid.cells)
+    visited[source] = 1
+    parent = grid.new_parents()
+    stack = [source]
+
+    while stack:
+        i = stack.pop()
+        result.expanded += 1
+        if explored is not None:
+            explored[i] = 1
+        yield i
+
+        if i == target:
+            result.path = grid.path(parent, target)
+            return
+
+        for offset in offsets:
+            j = i + offset
+            if not visited[j]:
+                visited[j] = 1
+                parent[j] = i
+                stack.append(j)
+                result.generated += 1
+        if len(stack) > result.max_frontier:
+            result.max_frontier = len(stack)
+
+
+def _ucs(grid, source, target, directions, result, explored, backward=False):
+    # Dial's algorithm: step costs are small integers, so the frontier is a
+    # ring of buckets indexed by cost instead of a heap. Every pushed cost is
+    # within max_step of the one being expanded, so max_step + 1 buckets
+    # never collide and push/pop are O(1).
+    #
+    # A step costs the weight of the cell it steps onto. With ``backward``
+    # the search runs from the goal over reversed moves: going from i to j
+    # stands for the forward step j -> i, which costs the weight of i.
+    # Returns the cost and parent arrays; ``result.path`` is set if
+    # ``target`` is reached
+    offsets = grid.neighbor_offsets(directions)
+    if backward:
+        offsets = [-offset for offset in offsets]
+    cells = grid.cells
+    weights = grid.weights
+    if weights is None:
+        weights = bytes(b'\x01') * len(cells)
+    ring = max(weights) + 1
+    buckets = [[] for _ in range(ring)]
+    dist = grid.new_costs()
+    dist[source] = 0
+    parent = grid.new_parents()
+    buckets[0].append(source)
+    pending = 1
+    cost = 0
+
+    while pending:
+        bucket = buckets[cost % ring]
+        while not bucket:
+            cost += 1
+            bucket = buckets[cost % ring]
+        i = bucket.pop()
+        pending -= 1
+        if dist[i] < cost:
+            continue  # A cheaper entry for this cell was already expanded
+        result.expanded += 1
+        if explored is not None:
+            explored[i] = 1
+        yield i
+
+        if i == target:
+            result.path = grid.path(parent, target)
+            break
+
+        step = weights[i] if backward else 0
+        for offset in offsets:
+            j = i + offset
+            new_cost = cost + (step or weights[j])
+            if not cells[j] and new_cost < dist[j]:
+                if dist[j] != UNREACHED_COST:
+                    result.duplicates += 1
+                dist[j] = new_cost
+                parent[j] = i
+                buckets[new_cost % ring].append(j)
+                pending += 1
+                result.generated += 1
+        if pending > result.max_frontier:
+            result.max_frontier = pending
+
+    return dist, parent
+
+
+def _dls(grid, source, target, directions, result, explored, depth_limit):
+    # Cells are settled level by level, which is the IDS engine stopped at
+    # the limit. A depth-first order would have to search a cell again
+    # whenever a shorter path to it turned up, up to cells x limit
+    # expansions; settling in depth order expands every cell once
+    if depth_limit < 1:
+        # Only the source is within reach
+        result.expanded += 1
+        if explored is not None:
+            explored[source] = 1
+        yield source
+        if source == target:
+            result.path = [grid.coords(source)]
+        return
+    yield from _ids(grid, source, target, directions, result, explored, depth_limit, None)
+
+
+def _a_star(grid, source, target, directions, result, explored):
+    offsets = grid.neighbor_offsets(directions)
+    width = grid.width
+    gx, gy = target % width, target // width
+    cells = grid.cells
+    closed = grid.new_mask()
+    parent = grid.new_parents()
+    best_g = grid.new_costs()
+    best_g[source] = 0
+    # Entries are (f, -g, flat index) so that among equal f the deeper node,
+    # which is closer to the goal, comes out first
+    pq = [(abs(source % width - gx) + abs(source // width - gy), 0, source)]
+
+    while pq:
+        f, neg_g, i = heapq.heappop(pq)
+
+        if closed[i]:
+            continue
+        closed[i] = 1
+        result.expanded += 1
+        if explored is not None:
+            explored[i] = 1
+        yield i
+
+        if i == target:
+            result.path = grid.path(parent, target)
+            return
+
+        new_g = 1 - neg_g
+        for offset in offsets:
+            j = i + offset
+            # Manhattan distance is consistent on a unit-cost grid, so a cell
+            # already closed never improves and fails this check too
+            if not cells[j] and new_g < best_g[j]:
+                if best_g[j] != UNREACHED_COST:
+                    result.duplicates += 1
+                best_g[j] = new_g
+                parent[j] = i
+                heapq.heappush(pq, (new_g + abs(j % width - gx) + abs(j // width - gy), -new_g, j))
+                result.generated += 1
+        if len(pq) > result.max_frontier:
+            result.max_frontier = len(pq)
+
+
+def _greedy(grid, source, target, directions, result, explored):
+    offsets = grid.neighbor_offsets(directions)
+    width = grid.width
+    gx, gy = target % width, target // width
+    closed = grid.new_mask()
+    # Cells pushed so far, only kept to count duplicate pushes
+    pushed = grid.new_mask()
+    pushed[source] = 1
+    parent = grid.new_parents()
+    cells = grid.cells
+    pq = [(abs(source % width - gx) + abs(source // width - gy), source, -1)]
+
+    while pq:
+        h, i, came_from = heapq.heappop(pq)
+
+        if closed[i]:
+            continue
+        closed[i] = 1
+        parent[i] = came_from
+        result.expanded += 1
+        if explored is not None:
+            explored[i] = 1
+        yield i
+
+        if i == target:
+            result.path = grid.path(parent, target)
+            return
+
+        for offset in offsets:
+            j = i + offset
+            if not cells[j] and not closed[j]:
+                heapq.heappush(pq, (abs(j % width - gx) + abs(j // width - gy), j, i))
+                result.generated += 1
+                if pushed[j]:
+                    result.duplicates += 1
+                pushed[j] = 1
+        if len(pq) > result.max_frontier:
+            result.max_frontier = len(pq)
+
+
+# The iterative-deepening searches return the depth limit or f bound of
+# their last iteration.
+
+
+def _ids(grid, source, target, directions, result, explored, max_depth, on_iteration):
+    # Level-synchronous: iteration ``depth_limit`` expands exactly the cells
+    # at depth ``depth_limit - 1``, found by the previous iteration, so the
+    # search carries on where the last limit stopped instead of starting
+    # over from the source, and every cell is expanded once
+    offsets = grid.neighbor_offsets(reversed(directions))
+    # Walls start out "visited", so one lookup covers both checks
+    visited = bytearray(grid.cells)
+    visited[source] = 1
+    parent = grid.new_parents()
+    level = [source]
+
+    for depth_limit in range(1, max_depth + 1):
+        if on_iteration:
+            on_iteration(depth_limit)
+
+        following = []
+        for k, i in enumerate(level):
+            result.expanded += 1
+            if explored is not None:
+                explored[i] = 1
+            yield i
+
+            if i == target:
+                result.path = grid.path(parent, target)
+                return depth_limit
+
+            for offset in offsets:
+                j = i + offset
+                if not visited[j]:
+                    visited[j] = 1
+                    parent[j] = i
+                    result.generated += 1
+                    # Every cell closer than the limit has been reached at its
+                    # true depth by now, so reaching the goal here is optimal
+                    if j == target:
+                        result.path = grid.path(parent, target)
+                        return depth_limit
+                    following.append(j)
+            if len(level) - k - 1 + len(following) > result.max_frontier:
+                result.max_frontier = len(level) - k - 1 + len(following)
+
+        level = following
+        if not level:
+            break
+
+    return max_depth
+
+
+def _reachable(grid, source, target, offsets):
+    # Flood fill from the source, in no particular order
+    visited = bytearray(grid.cells)
+    visited[source] = 1
+    stack = [source]
+    while stack:
+        i = stack.pop()
+        if i == target:
+            return True
+        for offset in offsets:
+            j = i + offset
+            if not visited[j]:
+                visited[j] = 1
+                stack.append(j)
+    return False
+
+
+def _ida_peak(result, generated, duplicates):
+    # Distinct cells pushed since the iteration began, plus the source
+    visited = 1 + result.generated - generated - (result.duplicates - duplicates)
+    if result.peak_visited is None or visited > result.peak_visited:
+        result.peak_visited = visited
+
+
+def _ida_star(grid, source, target, directions, result, explored, on_iteration):
+    offsets = grid.neighbor_offsets(reversed(directions))
+    width = grid.width
+    gx, gy = target % width, target // width
+    cells = grid.cells
+    bound = abs(source % width - gx) + abs(source // width - gy)
+    # Deepening towards an unreachable goal would try every bound up to the
+    # largest f in the maze, each one a depth-first search, so check with a
+    # single flood fill first
+    if not _reachable(grid, source, target, offsets):
+        return bound
+
+    while True:
+        if explored is not None:
+            explored[:] = bytes(len(explored))
+        if on_iteration:
+            on_iteration(bound)
+
+        # Cheapest g per cell in this iteration; a depth-first search that
+        # reaches a cell again at no lower cost is cut off there
+        best_g = grid.new_costs()
+        best_g[source] = 0
+        parent = grid.new_parents()
+        stack = [(source, 0)]
+        next_bound = UNREACHED_COST
+        # best_g starts afresh every iteration, so the visited peak is that
+        # of the largest single iteration
+        generated, duplicates = result.generated, result.duplicates
+
+        while stack:
+            i, g = stack.pop()
+            if g > best_g[i]:
+                continue
+            result.expanded += 1
+            if explored is not None:
+                explored[i] = 1
+            yield i
+
+            if i == target:
+                result.path = grid.path(parent, target)
+                _ida_peak(result, generated, duplicates)
+                return bound
+
+            new_g = g + 1
+            for offset in offsets:
+                j = i + offset
+                if cells[j] or new_g >= best_g[j]:
+                    continue
+                f = new_g + abs(j % width - gx) + abs(j // width - gy)
+                if f > bound:
+                    # The smallest f beyond the bound becomes the next bound
+                    if f < next_bound:
+                        next_bound = f
+                    continue
+                if best_g[j] != UNREACHED_COST:
+                    result.duplicates += 1
+                best_g[j] = new_g
+                parent[j] = i
+                stack.append((j, new_g))
+                result.generated += 1
+            if len(stack) > result.max_frontier:
+                result.max_frontier = len(stack)
+
+        _ida_peak(result, generated, duplicates)
+        if next_bound == UNREACHED_COST:
+            return bound  # Nothing was cut off, so the goal is unreachable
+        bound = next_bound
+
+
+def _join(grid, forward, backward, a, b):
+    # Forward parents lead from ``a`` back to the source, backward parents
+    # from ``b`` on to the target; ``a`` and ``b`` are the same or adjacent
+    path = grid.path(forward, a)
+    i = b
+    if b != a:
+        path.append(grid.coords(b))
+    while backward[i] != -1:
+        i = backward[i]
+        path.append(grid.coords(i))
+    return path
+
+
+# The bidirectional searches grow one tree from the source (side 0) and one
+# from the target (side 1), and yield expansions from both.
+
+
+def _bidirectional_bfs(grid, source, target, directions, result, explored):
+    offsets = grid.neighbor_offsets(directions)
+    cells = grid.cells
+    parents = grid.new_parents(), grid.new_parents()
+    dists = grid.new_costs(), grid.new_costs()
+    dists[0][source] = 0
+    dists[1][target] = 0
+    frontiers = [[source], [target]]
+    best = UNREACHED_COST if source != target else 0
+    meet = (source, target)
+
+    while frontiers[0] and frontiers[1]:
+        # Grow the smaller side by one whole level; once the trees touch,
+        # finishing the level guarantees the shortest meeting was seen
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        dist, other, parent = dists[side], dists[1 - side], parents[side]
+        level = []
+        for i in frontiers[side]:
+            result.expanded += 1
+            if explored is not None:
+                explored[i] = 1
+            yield i
+
+            if best == 0:
+                break
+
+            d = dist[i] + 1
+            for offset in offsets:
+                j = i + offset
+                if cells[j]:
+                    continue
+                if other[j] != UNREACHED_COST and d + other[j] < best:
+                    best = d + other[j]
+                    meet = (i, j) if side == 0 else (j, i)
+                if dist[j] == UNREACHED_COST:
+                    dist[j] = d
+                    parent[j] = i
+                    level.append(j)
+                    result.generated += 1
+        frontiers[side] = level
+        if len(frontiers[0]) + len(frontiers[1]) > result.max_frontier:
+            result.max_frontier = len(frontiers[0]) + len(frontiers[1])
+
+        if best != UNREACHED_COST:
+            result.path = _join(grid, parents[0], parents[1], *meet)
+            return
+
+
+def _bidirectional_a_star(grid, source, target, directions, result, explored):
+    offsets = grid.neighbor_offsets(directions)
+    width = grid.width
+    cells = grid.cells
+    # Each side heads for the other side's root
+    heads = (target % width, target // width), (source % width, source // width)
+    closed = grid.new_mask(), grid.new_mask()
+    parents = grid.new_parents(), grid.new_parents()
+    costs = grid.new_costs(), grid.new_costs()
+    costs[0][source] = 0
+    costs[1][target] = 0
+    h = abs(source % width - heads[0][0]) + abs(source // width - heads[0][1])
+    heaps = [(h, 0, source)], [(h, 0, target)]
+    best = UNREACHED_COST if source != target else 0
+    meet = source
+
+    while heaps[0] and heaps[1]:
+        # Every path not found yet costs at least the smallest f on either
+        # side, so stop once the best meeting cannot be beaten
+        if best <= max(heaps[0][0][0], heaps[1][0][0]):
+            break
+
+        side = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+        heap, g, other, parent = heaps[side], costs[side], costs[1 - side], parents[side]
+        gx, gy = heads[side]
+        f, neg_g, i = heapq.heappop(heap)
+
+        if closed[side][i]:
+            continue
+        closed[side][i] = 1
+        result.expanded += 1
+        if explored is not None:
+            explored[i] = 1
+        yield i
+
+        new_g = 1 - neg_g
+        for offset in offsets:
+            j = i + offset
+            if not cells[j] and new_g < g[j]:
+                if g[j] != UNREACHED_COST:
+                    result.duplicates += 1
+                g[j] = new_g
+                parent[j] = i
+                heapq.heappush(heap, (new_g + abs(j % width - gx) + abs(j // width - gy), -new_g, j))
+                result.generated += 1
+                if other[j] != UNREACHED_COST and new_g + other[j] < best:
+                    best = new_g + other[j]
+                    meet = j
+        if len(heaps[0]) + len(heaps[1]) > result.max_frontier:
+            result.max_frontier = len(heaps[0]) + len(heaps[1])
+
+    if best != UNREACHED_COST:
+        result.path = _join(grid, parents[0], parents[1], meet, meet)
+
+
+def bfs_steps(maze, start=None, goal=None, directions=DIRECTIONS):
+    return _steps(_bfs, maze, start, goal, directions)
+
+
+def bfs_solve(maze, start=None, goal=None, directions=DIRECTIONS, on_expand=None):
+    return _solve(_bfs, maze, start, goal, directions, on_expand)
+
+
+def dfs_steps(maze, start=None, goal=None, directions=DIRECTIONS):
+    return _steps(_dfs, maze, start, goal, directions)
+
+
+def dfs_solve(maze, start=None, goal=None, directions=DIRECTIONS, on_expand=None):
+    return _solve(_dfs, maze, start, goal, directions, on_expand)
+
+
+def ucs_steps(maze, start=None, goal=None, directions=DIRECTIONS):
+    return _steps(_ucs, maze, start, goal, directions)
+
+
+def ucs_solve(maze, start=None, goal=None, directions=DIRECTIONS, on_expand=None):
+    return _solve(_ucs, maze, start, goal, directions, on_expand)
+
+
+def dls_steps(maze, depth_limit, start=None, goal=None, directions=DIRECTIONS):
+    """Depth-Limited Search, one expansion per step.
+
+    Finds the goal if it is at most ``depth_limit`` steps away. Cells are
+    settled in depth order (the :func:`ids_steps` pass stopped at the
+    limit), so each one is expanded at most once and the path is shortest.
+    """
+    return _steps(_dls, maze, start, goal, directions, depth_limit)
+
+
+def dls_solve(maze, depth_limit, start=None, goal=None, directions=DIRECTIONS, on_expand=None):
+    """Depth-Limited Search; see :func:`dls_steps`."""
+    return _solve(_dls, maze, start, goal, directions, on_expand, depth_limit)
+
+
+def dls_sweep(maze, depth_limits, start=None, goal=None, directions=DIRECTIONS):
+    """Find the smallest of ``depth_limits`` at which DLS reaches the goal.
+
+    All limits are answered by one deepening pass up to the largest of them
+    instead of one DLS run each. Returns ``(result, depth_limit)``, with
+    ``depth_limit`` None if no limit is deep enough.
+    """
+    depth_limits = sorted(depth_limits)
+    if not depth_limits:
+        return SearchResult(), None
+    result, depth = ids_solve(maze, max(depth_limits[-1], 1), start, goal, directions)
+    if result.path is None:
+        return result, None
+    # The goal is reachable within every limit at least as deep as its distance
+    distance = len(result.path) - 1
+    depth_limit = next((limit for limit in depth_limits if limit >= distance), None)
+    if depth_limit is None:
+        result.path = None
+    return result, depth_limit
+
+
+def a_star_steps(maze, start=None, goal=None, directions=DIRECTIONS):
+    return _steps(_a_star, maze, start, goal, directions)
+
+
+def a_star_solve(maze, start=None, goal=None, directions=DIRECTIONS, on_expand=None):
+    return _solve(_a_star, maze, start, goal, directions, on_expand)
+
+
+def greedy_steps(maze, start=None, goal=None, directions=DIRECTIONS):
+    return _steps(_greedy, maze, start, goal, directions)
+
+
+def greedy_solve(maze, start=None, goal=None, directions=DIRECTIONS, on_expand=None):
+    return _solve(_greedy, maze, start, goal, directions, on_expand)
+
+
+def bidirectional_bfs_steps(maze, start=None, goal=None, directions=DIRECTIONS):
+    return _steps(_bidirectional_bfs, maze, start, goal, directions)
+
+
+def bidirectional_bfs_solve(maze, start=None, goal=None, directions=DIRECTIONS, on_expand=None):
+    return _solve(_bidirectional_bfs, maze, start, goal, directions, on_expand)
+
+
+def bidirectional_a_star_steps(maze, start=None, goal=None, directions=DIRECTIONS):
+    return _steps(_bidirectional_a_star, maze, start, goal, directions)
+
+
+def bidirectional_a_star_solve(maze, start=None, goal=None, directions=DIRECTIONS, on_expand=None):
+    return _solve(_bidirectional_a_star, maze, start, goal, directions, on_expand)
+
+
+def _deepening_steps(search, maze, start, goal, directions, *args):
+    # Like _steps, but the core search returns the final limit, which is
+    # passed on next to the result
+    grid = as_grid(maze)
+    source, target = _endpoints(grid, start, goal)
+    result = SearchResult(generated=1, max_frontier=1)
+    explored = grid.new_mask()
+    view = CellMask(grid, explored)
+    core = search(grid, source, target, directions, result, explored, *args)
+    while True:
+        try:
+            i = next(core)
+        except StopIteration as stop:
+            return _finish(result), stop.value
+        yield grid.coords(i), view
+
+
+def _deepening_solve(search, maze, start, goal, directions, on_expand, *args):
+    if on_expand:
+        return run_steps(_deepening_steps(search, maze, start, goal, directions, *args), on_expand)
+    grid = as_grid(maze)
+    source, target = _endpoints(grid, start, goal)
+    result = SearchResult(generated=1, max_frontier=1)
+    core = search(grid, source, target, directions, result, None, *args)
+    while True:
+        try:
+            next(core)
+        except StopIteration as stop:
+            return _finish(result), stop.value
+
+
+def ids_steps(maze, max_depth, start=None, goal=None, directions=DIRECTIONS, on_iteration=None):
+    """Iterative Deepening Search, one expansion per step.
+
+    The search is level-synchronous: each new depth limit expands only the
+    cells at the previous limit's depth, which that iteration left behind,
+    rather than repeating a depth-first search from the source. Every cell
+    is expanded at most once and paths are shortest.
+
+    Returns ``(result, depth_limit)`` where ``depth_limit`` is the limit the goal
+    was found at (or ``max_depth`` if it was never reached). ``on_iteration`` is
+    called with each new depth limit before that iteration starts.
+    """
+    return _deepening_steps(_ids, maze, start, goal, directions, max_depth, on_iteration)
+
+
+def ids_solve(maze, max_depth, start=None, goal=None, directions=DIRECTIONS,
+              on_expand=None, on_iteration=None):
+    """Iterative Deepening Search; see :func:`ids_steps`."""
+    return _deepening_solve(_ids, maze, start, goal, directions, on_expand, max_depth, on_iteration)
+
+
+def ida_star_steps(maze, start=None, goal=None, directions=DIRECTIONS, on_iteration=None):
+    """IDA*, one expansion per step.
+
+    Returns ``(result, bound)`` where ``bound`` is the f bound of the last
+    iteration, which is the path length when a path was found.
+    ``on_iteration`` is called with each new bound before that iteration starts.
+    """
+    return _deepening_steps(_ida_star, maze, start, goal, directions, on_iteration)
+
+
+def ida_star_solve(maze, start=None, goal=None, directions=DIRECTIONS, on_expand=None, on_iteration=None):
+    """IDA*; see :func:`ida_star_steps`."""
+    return _deepening_solve(_ida_star, maze, start, goal, directions, on_expand, on_iteration)
@@ -0,0 +1,142 @@
+"""Structured counters for one solver run, emitted as a JSON record.
+
+A :class:`SearchTrace` is started right before a search and finished with
+its :class:`~maze_core.solvers.SearchResult`. Front-ends wrap the step
+generator with :meth:`SearchTrace.steps` and their drawing callbacks with
+:meth:`SearchTrace.timed` (:meth:`StepScheduler.run
+<maze_core.scheduler.StepScheduler.run>` does both when given the trace), so
+that the wall time splits into search, rendering and whatever is left
+(mostly waiting for the next frame).
+
+The finished record is handed to every hook in ``HOOKS`` (and to any passed
+to the trace itself); :func:`json_lines` is the usual one::
+
+    add_hook(json_lines())
+    trace = SearchTrace('bfs', maze)
+    result = scheduler.run(bfs_steps(maze), on_step, renderer.flush, trace)
+    trace.finish(result)
+
+Record fields:
+
+* ``nodes_expanded``, ``nodes_generated``, ``peak_frontier`` and
+  ``duplicate_pushes`` come straight from the result.
+* ``peak_visited`` is the most distinct cells a search held as visited at
+  once, as reported by the solver. Searches that never forget a pushed
+  cell report ``generated - duplicates``; IDA* reports its largest
+  iteration. It is ``null`` where no such count exists: the genetic
+  solver, HPA* and D* Lite repairs.
+* ``path_copy_bytes`` is the memory taken by the returned path list and its
+  ``(x, y)`` tuples, the one path copy each search makes.
+* ``search_time_s`` is the time spent advancing the wrapped steps (or, if
+  they were not wrapped, all the time outside timed callbacks),
+  ``render_time_s`` the time inside timed callbacks and ``wall_time_s``
+  the whole run.
+"""
+
+import json
+import sys
+import time
+
+from .grid import Grid
+
+# Called with every finished record, in order
+HOOKS = []
+
+
+def add_hook(hook):
+    """Call ``hook(record)`` for every trace finished from now on."""
+    HOOKS.append(hook)
+    return hook
+
+
+def remove_hook(hook):
+    HOOKS.remove(hook)
+
+
+def json_lines(stream=None):
+    """Hook writing each record as one line of JSON (to stdout by default)."""
+    def write(record):
+        out = sys.stdout if stream is None else stream
+        out.write(json.dumps(record) + '\n')
+        out.flush()
+    return write
+
+
+def _path_bytes(path):
+    if path is None:
+        return 0
+    return sys.getsizeof(path) + sum(sys.getsizeof(cell) for cell in path)
+
+
+class SearchTrace:
+    __slots__ = ('algo', 'rows', 'cols', 'hooks', 'fields', 'started', 'search_time', 'render_time')
+
+    def __init__(self, algo, maze, hooks=(), **fields):
+        # ``fields`` (a seed, a generator name, ...) are copied into the record
+        self.algo = algo
+        if isinstance(maze, Grid):
+            self.rows, self.cols = maze.rows, maze.cols
+        else:
+            self.rows, self.cols = len(maze), len(maze[0])
+        self.hooks = list(hooks)
+        self.fields = fields
+        self.search_time = None  # Measured only when the steps are wrapped
+        self.render_time = 0.0
+        self.started = time.perf_counter()
+
+    def steps(self, steps):
+        """Wrap a ``*_steps`` generator so the time spent advancing it counts as search."""
+        self.search_time = 0.0
+        while True:
+            # Timed callbacks the search makes itself (e.g. on_iteration)
+            # count as rendering only
+            start, rendered = time.perf_counter(), self.render_time
+            try:
+                item = next(steps)
+            except StopIteration as stop:
+                self.search_time += time.perf_counter() - start - (self.render_time - rendered)
+                return stop.value
+            self.search_time += time.perf_counter() - start - (self.render_time - rendered)
+            yield item
+
+    def timed(self, callback):
+        """Wrap ``callback`` so the time spent in it counts as rendering."""
+        if callback is None:
+            return None
+
+        def wrapper(*args):
+            start = time.perf_counter()
+            try:
+                return callback(*args)
+            finally:
+                self.render_time += time.perf_counter() - start
+        return wrapper
+
+    def finish(self, result, **extra):
+        """Build the record for ``result``, pass it to the hooks and return it.
+
+        ``extra`` fields (a depth limit, ...) are added to the record.
+        """
+        total = time.perf_counter() - self.started
+        search = total - self.render_time if self.search_time is None else self.search_time
+        record = {
+            'algo': self.algo,
+            'rows': self.rows,
+            'cols': self.cols,
+            'solved': result.path is not None,
+            'path_length': len(result.path) - 1 if result.path else None,
+            'nodes_expanded': result.expanded,
+            'nodes_generated': result.generated,
+            'duplicate_pushes': result.duplicates,
+            'peak_frontier': result.max_frontier,
+            'peak_visited': result.peak_visited,
+            'path_copy_bytes': _path_bytes(result.path),
+            'search_time_s': round(search, 6),
+            'render_time_s': round(self.render_time, 6),
+            'wall_time_s': round(total, 6),
+        }
+        record.update(self.fields)
+        record.update(extra)
+        for hook in HOOKS + self.hooks:
+            hook(record)
+        return record
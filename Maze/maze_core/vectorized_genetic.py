@@ -0,0 +1,156 @@
+"""Genetic-algorithm maze solver that evolves the whole population as arrays.
+
+Same model as :mod:`maze_core.genetic`, but the population is an ``int8``
+matrix with one row per individual and one move per column (indices into
+``DIR_KEYS``). Every individual is replayed in lockstep, one column at a time,
+through a precomputed transition table, so a move costs one add and one
+gather for the whole population. Selection uses ``argpartition``, crossover is
+a masked copy and mutation a scatter, so the cost per generation is a few
+dozen NumPy calls whatever the population size.
+
+Fitness is minus the closest an individual gets to the goal, measured with the
+cached :func:`~maze_core.fields.flow_field` of the goal. An individual that walks
+through the goal at any point solves the maze; the first such individual is
+reported as the best of its generation.
+
+NumPy is only needed for this module; ``import maze_core`` does not pull it in.
+"""
+
+import numpy as np
+
+from .fields import flow_field
+from .genetic import DIR_KEYS, DIR_MAP
+from .grid import as_grid
+from .solvers import SearchResult, run_steps
+
+
+def _move_offsets(grid):
+    return np.array([DIR_MAP[key][0] + DIR_MAP[key][1] * grid.width for key in DIR_KEYS], dtype=np.intp)
+
+
+def _transition_table(grid, target, offsets):
+    # States are (passed_goal * cells + cell) * 4, so that adding a move index
+    # and looking the sum up gives the next state. Walls and the border map
+    # back to the same cell, and stepping onto the target sets the flag.
+    size = len(grid.cells)
+    walls = np.frombuffer(grid.cells, dtype=np.uint8).view(bool)
+    cells = np.arange(size, dtype=np.intp)[:, None]
+    step = np.clip(cells + offsets, 0, size - 1)
+    step = np.where(walls[step], cells, step)
+    passed = np.stack([step == target, np.ones_like(step, dtype=bool)])
+    return ((passed * size + step) * 4).astype(np.int32).ravel()
+
+
+def _replay(table, size, genes, source, target, distances=None):
+    # Returns the final flat positions and whether each row passed the goal.
+    # Given per-state ``distances``, returns each row's closest approach to
+    # the goal instead of its final position.
+    state = np.full(len(genes), (source + size * (source == target)) * 4, dtype=np.int32)
+    scratch = np.empty_like(state)
+    if distances is not None:
+        closest = distances[state]
+        near = np.empty_like(state)
+    # Moves are replayed a column at a time, so lay the columns out contiguously
+    for column in np.ascontiguousarray(genes.T):
+        np.add(state, column, out=scratch)
+        np.take(table, scratch, out=state)
+        if distances is not None:
+            np.take(distances, state, out=near)
+            np.minimum(closest, near, out=closest)
+    state //= 4
+    return state % size if distances is None else closest, state >= size
+
+
+def evaluate_population(grid, genes, source, target):
+    """Replay every row of ``genes`` from the flat index ``source``.
+
+    Returns the final flat positions and a flag per row telling whether it
+    passed through ``target``.
+    """
+    table = _transition_table(grid, target, _move_offsets(grid))
+    return _replay(table, len(grid.cells), genes, source, target)
+
+
+def _state_distances(grid, goal, cache=True):
+    # The distances to the goal, laid out like the transition table so that
+    # they can be indexed by state
+    distances = np.frombuffer(flow_field(grid, goal, cache=cache).dist, dtype=np.int32)
+    return np.tile(np.repeat(distances, 4), 2)
+
+
+def _next_generation(genes, scores, rng, mutation_rate):
+    pop_size, path_len = genes.shape
+    elite = max(pop_size // 2, 1)
+    # Top half by score, in no particular order
+    top = np.argpartition(scores, pop_size - elite)[pop_size - elite:]
+    parents = top[rng.integers(0, elite, size=(2, pop_size))]
+    points = rng.integers(1, max(path_len, 2), size=pop_size)
+    children = genes[parents[0]]
+    np.copyto(children, genes[parents[1]], where=np.arange(path_len) >= points[:, None])
+    # Draw how many genes mutate, then which ones, instead of one random
+    # number per gene
+    count = rng.binomial(children.size, mutation_rate)
+    children.flat[rng.integers(0, children.size, size=count)] = rng.integers(0, len(DIR_KEYS), size=count, dtype=np.int8)
+    return children
+
+
+def _best_path(grid, moves, source, target, offsets):
+    # Cells actually visited by one individual, stopping at the goal
+    cells = grid.cells
+    i = source
+    path = [grid.coords(i)]
+    for move in moves:
+        j = i + int(offsets[move])
+        if not cells[j]:
+            i = j
+            path.append(grid.coords(i))
+            if i == target:
+                break
+    return path
+
+
+def vectorized_genetic_steps(maze, pop_size=100, generations=100, path_len=None,
+                             start=(0, 0), goal=None, mutation_rate=0.1, seed=None):
+    """Evolve the population as one matrix, one generation per step.
+
+    Yields ``(generation, best_score, path_coords)`` like
+    :func:`maze_core.genetic.genetic_steps` and returns the
+    :class:`SearchResult`.
+    """
+    grid = as_grid(maze)
+    if goal is None:
+        goal = (grid.cols - 1, grid.rows - 1)
+    if path_len is None:
+        path_len = 2 * (grid.rows + grid.cols)
+    rng = np.random.default_rng(seed)
+    offsets = _move_offsets(grid)
+    source, target = grid.index(*start), grid.index(*goal)
+    table = _transition_table(grid, target, offsets)
+    distances = _state_distances(grid, goal)
+
+    genes = rng.integers(0, len(DIR_KEYS), size=(pop_size, path_len), dtype=np.int8)
+    result = SearchResult()
+
+    for generation in range(generations):
+        closest, reached = _replay(table, len(grid.cells), genes, source, target, distances)
+        scores = -closest
+        result.expanded += pop_size * path_len
+
+        best = int(np.argmax(reached)) if reached.any() else int(np.argmax(scores))
+        path_coords = _best_path(grid, genes[best], source, target, offsets)
+        yield generation, int(scores[best]), path_coords
+        if path_coords[-1] == goal:
+            result.path = path_coords
+            return result
+
+        genes = _next_generation(genes, scores, rng, mutation_rate)
+        result.generated += pop_size
+
+    return result
+
+
+def vectorized_genetic_solve(maze, pop_size=100, generations=100, path_len=None, start=(0, 0),
+                             goal=None, mutation_rate=0.1, seed=None, on_generation=None):
+    """Run :func:`vectorized_genetic_steps` to the end."""
+    steps = vectorized_genetic_steps(maze, pop_size, generations, path_len, start, goal, mutation_rate, seed)
+    return run_steps(steps, on_generation)
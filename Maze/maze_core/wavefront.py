@@ -0,0 +1,95 @@
+"""Level-synchronous BFS that expands a whole frontier per NumPy call.
+
+This is a drop-in alternative to :func:`maze_core.solvers.bfs_solve` for very
+large single mazes. Instead of popping one cell at a time, each BFS level is a
+handful of array operations over the frontier: gather every neighbour of every
+frontier cell, keep the ones that are still unreached, and stamp them with the
+level number. The result is a distance field, from which the path is traced
+back from the goal by always stepping to a neighbour one level closer.
+
+NumPy is only needed for this module; ``import maze_core`` does not pull it in.
+"""
+
+import numpy as np
+
+from .grid import as_grid
+from .solvers import DIRECTIONS, SearchResult, _endpoints
+
+UNREACHED = -1
+WALL = -2
+
+
+def _wavefront(grid, source, offsets, target=None):
+    """Fill distances from ``source`` level by level.
+
+    Stops as soon as ``target`` is reached when one is given. Returns the flat
+    distance array (``UNREACHED``/``WALL`` for the rest), the number of cells
+    reached and the largest frontier seen.
+    """
+    # Open cells (0) become UNREACHED and walls (1) become WALL
+    dist = np.frombuffer(grid.cells, dtype=np.uint8).astype(np.int32)
+    np.subtract(UNREACHED, dist, out=dist)
+    dist[source] = 0
+    offsets = np.asarray(offsets, dtype=np.intp)
+    frontier = np.array([source], dtype=np.intp)
+    reached = max_frontier = 1
+    level = 0
+
+    while frontier.size:
+        if target is not None and dist[target] >= 0:
+            break
+        level += 1
+        candidates = (frontier[:, None] + offsets).ravel()
+        candidates = candidates[dist.take(candidates) == UNREACHED]
+        # Two frontier cells can share a neighbour; keep it once. Each
+        # candidate writes its position into dist and only the last write to
+        # a cell survives, which dedupes without sorting or a scratch array.
+        order = np.arange(candidates.size, dtype=np.int32)
+        dist[candidates] = order
+        frontier = candidates[dist.take(candidates) == order]
+        dist[frontier] = level
+        reached += frontier.size
+        max_frontier = max(max_frontier, frontier.size)
+
+    return dist, reached, max_frontier
+
+
+def distance_field(maze, start=None, directions=DIRECTIONS):
+    """BFS distance from ``start`` to every cell as a ``(rows, cols)`` array.
+
+    Walls are ``-2`` and open cells that cannot be reached are ``-1``.
+    """
+    grid = as_grid(maze)
+    source, _ = _endpoints(grid, start, None)
+    dist, _, _ = _wavefront(grid, source, grid.neighbor_offsets(directions))
+    return dist.reshape(grid.rows + 2, grid.width)[1:-1, 1:-1]
+
+
+def wavefront_bfs_solve(maze, start=None, goal=None, directions=DIRECTIONS):
+    """Shortest path by vectorized BFS.
+
+    Returns a path of the same length as :func:`bfs_solve`; when several
+    shortest paths exist the one chosen may differ.
+    """
+    grid = as_grid(maze)
+    source, target = _endpoints(grid, start, goal)
+    offsets = grid.neighbor_offsets(directions)
+    dist, reached, max_frontier = _wavefront(grid, source, offsets, target)
+    result = SearchResult(expanded=reached, generated=reached, max_frontier=max_frontier, peak_visited=reached)
+
+    if dist[target] < 0:
+        return result
+
+    # Walk downhill from the goal; memoryview indexing avoids NumPy scalars
+    view = memoryview(dist)
+    path = [target]
+    i = target
+    for d in range(view[target] - 1, -1, -1):
+        for offset in offsets:
+            if view[i + offset] == d:
+                i += offset
+                break
+        path.append(i)
+    path.reverse()
+    result.path = [grid.coords(i) for i in path]
+    return result
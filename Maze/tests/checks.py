@@ -0,0 +1,42 @@
+"""Seeded mazes and path checks shared by the solver tests."""
+
+import random
+
+from maze_core.generators import ALGORITHMS, generate_grid
+
+SIZE = 25
+
+# (generator, obstacle divisor, seed); the dense open mazes are there so that
+# some queries have no path
+MAZES = [(algorithm, 8 if algorithm == 'open' else 0, seed) for algorithm in ALGORITHMS for seed in range(3)]
+MAZES += [('open', 2, seed) for seed in range(3)]
+
+
+def maze_id(maze):
+    algorithm, density, seed = maze
+    return f"{algorithm}-{density}-{seed}"
+
+
+def build(maze, terrain=0):
+    algorithm, density, seed = maze
+    obstacles = SIZE * SIZE // density if density else 0
+    return generate_grid(SIZE, SIZE, obstacles, seed, algorithm, terrain)
+
+
+def queries(grid, count, seed):
+    """The corner-to-corner query and ``count`` random ones between open cells."""
+    rng = random.Random(seed)
+    cells = [(x, y) for y in range(grid.rows) for x in range(grid.cols) if grid.is_open(x, y)]
+    return [((0, 0), (grid.cols - 1, grid.rows - 1))] + [tuple(rng.sample(cells, 2)) for _ in range(count)]
+
+
+def path_cost(grid, path):
+    return sum(grid.cost(x, y) for x, y in path[1:])
+
+
+def assert_path(grid, path, start, goal):
+    """Fail unless ``path`` walks from ``start`` to ``goal`` over open cells."""
+    assert path[0] == start and path[-1] == goal
+    assert all(grid.is_open(x, y) for x, y in path)
+    for (x0, y0), (x1, y1) in zip(path, path[1:]):
+        assert abs(x1 - x0) + abs(y1 - y0) == 1
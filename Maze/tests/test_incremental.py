@@ -0,0 +1,40 @@
+"""D* Lite repairs against a fresh UCS after every change."""
+
+import random
+
+import pytest
+
+from maze_core.incremental import DStarLite
+from maze_core.solvers import ucs_solve
+
+from .checks import MAZES, assert_path, build, maze_id, path_cost
+
+ROUNDS = 40
+
+
+@pytest.mark.parametrize('terrain', [0, 200])
+@pytest.mark.parametrize('maze', MAZES, ids=maze_id)
+def test_repairs_match_ucs(maze, terrain):
+    grid = build(maze, terrain)
+    rng = random.Random(maze[2])
+    start, goal = (0, 0), (grid.cols - 1, grid.rows - 1)
+    planner = DStarLite(grid, start, goal)
+    cells = [(x, y) for y in range(grid.rows) for x in range(grid.cols)]
+
+    for _ in range(ROUNDS):
+        path = planner.solve().path
+        expected = ucs_solve(grid, start, goal).path
+        if expected is None:
+            assert path is None
+        else:
+            assert_path(grid, path, start, goal)
+            assert path_cost(grid, path) == path_cost(grid, expected)
+
+        # Walk a few steps along the plan now and then, then change the maze
+        if path and len(path) > 3 and rng.random() < 0.3:
+            start = path[rng.randint(1, 3)]
+            planner.move_start(start)
+        for _ in range(rng.randint(1, 3)):
+            cell = rng.choice(cells)
+            if cell not in (start, goal):
+                planner.toggle(cell)
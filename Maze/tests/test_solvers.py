@@ -0,0 +1,98 @@
+"""Unweighted searches against the BFS optimum."""
+
+import pytest
+
+from maze_core.bitboard import bitboard_bfs_solve
+from maze_core.hpa import build_hierarchy
+from maze_core.jps import jps_solve
+from maze_core.solvers import (
+    a_star_solve,
+    bfs_solve,
+    bidirectional_a_star_solve,
+    bidirectional_bfs_solve,
+    dfs_solve,
+    dls_solve,
+    greedy_solve,
+    ida_star_solve,
+    ids_solve,
+    ucs_solve,
+)
+
+from .checks import MAZES, assert_path, build, maze_id, queries
+
+SHORTEST = {
+    'bibfs': bidirectional_bfs_solve,
+    'astar': a_star_solve,
+    'biastar': bidirectional_a_star_solve,
+    'jps': jps_solve,
+    'ucs': ucs_solve,
+    'bitboard': bitboard_bfs_solve,
+    'ids': lambda grid, start, goal: ids_solve(grid, grid.rows * grid.cols, start, goal)[0],
+    'idastar': lambda grid, start, goal: ida_star_solve(grid, start, goal)[0],
+}
+
+ANY_PATH = {
+    'dfs': dfs_solve,
+    'greedy': greedy_solve,
+}
+
+mazes = pytest.mark.parametrize('maze', MAZES, ids=maze_id)
+
+
+@mazes
+@pytest.mark.parametrize('name', SHORTEST)
+def test_shortest(name, maze):
+    grid = build(maze)
+    for start, goal in queries(grid, 8, maze[2]):
+        expected = bfs_solve(grid, start, goal).path
+        path = SHORTEST[name](grid, start, goal).path
+        if expected is None:
+            assert path is None
+        else:
+            assert_path(grid, path, start, goal)
+            assert len(path) == len(expected)
+
+
+@mazes
+@pytest.mark.parametrize('name', ANY_PATH)
+def test_any_path(name, maze):
+    grid = build(maze)
+    for start, goal in queries(grid, 8, maze[2]):
+        expected = bfs_solve(grid, start, goal).path
+        path = ANY_PATH[name](grid, start, goal).path
+        if expected is None:
+            assert path is None
+        else:
+            assert_path(grid, path, start, goal)
+
+
+@mazes
+def test_dls_limit(maze):
+    # The goal is found exactly when the limit reaches the shortest distance
+    grid = build(maze)
+    for start, goal in queries(grid, 8, maze[2]):
+        expected = bfs_solve(grid, start, goal).path
+        if expected is None:
+            assert dls_solve(grid, grid.rows * grid.cols, start, goal).path is None
+            continue
+        depth = len(expected) - 1
+        path = dls_solve(grid, depth, start, goal).path
+        assert_path(grid, path, start, goal)
+        assert len(path) - 1 == depth
+        if depth:
+            assert dls_solve(grid, depth - 1, start, goal).path is None
+
+
+@mazes
+def test_hpa(maze):
+    # Paths through the entrances may be longer than the optimum, never shorter
+    grid = build(maze)
+    hierarchy = build_hierarchy(grid, cluster_size=8)
+    for start, goal in queries(grid, 8, maze[2]):
+        expected = bfs_solve(grid, start, goal).path
+        path = hierarchy.solve(start, goal).path
+        if expected is None:
+            assert path is None
+        else:
+            assert_path(grid, path, start, goal)
+            assert len(path) >= len(expected)
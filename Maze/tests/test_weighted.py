@@ -0,0 +1,70 @@
+"""Weighted UCS and flow fields against a plain heap Dijkstra."""
+
+import heapq
+
+import pytest
+
+from maze_core.fields import clear_field_cache, flow_field
+from maze_core.grid import UNREACHED_COST
+from maze_core.solvers import DIRECTIONS, ucs_solve
+
+from .checks import MAZES, assert_path, build, maze_id, path_cost, queries
+
+TERRAIN = 200
+
+
+def costs_to(grid, goal):
+    """Cheapest cost from every open cell to ``goal``, by cell."""
+    costs = {goal: 0}
+    heap = [(0, goal)]
+    while heap:
+        cost, (x, y) = heapq.heappop(heap)
+        if cost > costs[(x, y)]:
+            continue
+        # Stepping from a neighbour onto (x, y) costs the weight of (x, y)
+        step = grid.cost(x, y)
+        for dx, dy in DIRECTIONS:
+            cell = (x + dx, y + dy)
+            if grid.is_open(*cell) and cost + step < costs.get(cell, UNREACHED_COST):
+                costs[cell] = cost + step
+                heapq.heappush(heap, (cost + step, cell))
+    return costs
+
+
+mazes = pytest.mark.parametrize('maze', MAZES, ids=maze_id)
+
+
+@mazes
+def test_ucs(maze):
+    grid = build(maze, TERRAIN)
+    for start, goal in queries(grid, 8, maze[2]):
+        expected = costs_to(grid, goal).get(start)
+        path = ucs_solve(grid, start, goal).path
+        if expected is None:
+            assert path is None
+        else:
+            assert_path(grid, path, start, goal)
+            assert path_cost(grid, path) == expected
+
+
+@mazes
+def test_flow_field(maze):
+    grid = build(maze, TERRAIN)
+    clear_field_cache()
+    for _, goal in queries(grid, 4, maze[2]):
+        costs = costs_to(grid, goal)
+        field = flow_field(grid, goal)
+        assert flow_field(grid, goal) is field
+        fresh = flow_field(grid, goal, cache=False)
+        assert fresh is not field and fresh.dist == field.dist
+        for y in range(grid.rows):
+            for x in range(grid.cols):
+                start = (x, y)
+                expected = costs.get(start)
+                if expected is None:
+                    assert field.distance(start) is None and field.path(start) is None
+                    continue
+                assert field.distance(start) == expected
+                path = field.path(start)
+                assert_path(grid, path, start, goal)
+                assert path_cost(grid, path) == expected